@@ -0,0 +1,78 @@
+import numpy as np
+
+from solver import generate_map, trace_path
+from wavefront import expand_layer
+
+
+
+def generate_maps(n, col, row, rng=np.random):
+    """Creates a stack of independent random maps, in the same way as solver.generate_map.
+
+    Args:
+        n (int): number of maps.
+        col (int): number of columns of each map.
+        row (int): number of rows of each map.
+        rng: source of randomness, see solver.generate_map.
+
+    Returns:
+        NumPy array [n, col, row], NumPy array [n, 2], NumPy array [n, 2]: the maps, followed by the start and goal
+            coordinates of each map.
+    """
+    grids = np.empty((n, col, row), dtype=np.int64)
+    starts = np.empty((n, 2), dtype=np.int64)
+    goals = np.empty((n, 2), dtype=np.int64)
+    for i in range(n):
+        grids[i], starts[i], goals[i] = generate_map(col, row, rng)
+    return grids, starts, goals
+
+
+def solve_batch(grids, starts, goals, paths=False):
+    """Finds the shortest path on every map of the stack at once. All of the maps are explored together one BFS layer at
+    a time, see wavefront.expand_layer, and each map stops after the same layer as the BFS of Adventurer would. Maps which
+    are complete are regularly dropped from the stack being explored, such that the remaining ones aren't slowed down.
+
+    Args:
+        grids (NumPy array [n, col, row]): maps where walls are -1, every other value is treated as an empty square.
+            They are not modified.
+        starts (NumPy array [n, 2]): where the exploration begins on each map.
+        goals (NumPy array [n, 2]): the square to be reached on each map.
+        paths (Bool): if the route from start to goal should also be found for every map, default is False.
+
+    Returns:
+        NumPy array [n, col, row], NumPy bool array [n], List of (List of (int, int) or None): the explored maps,
+            holding the distance from the start for each visited square, if the goal of each map was reached, and the
+            route of each map, which is None if the goal can't be reached. The routes are only returned if requested.
+    """
+    starts = np.asarray(starts)
+    goals = np.asarray(goals)
+    n = len(grids)
+    distances = np.where(grids == -1, -1, -2)
+    distances[np.arange(n), starts[:, 0], starts[:, 1]] = 0
+
+    # Working copies of the maps which are still being explored, and which map of the stack each one belongs to.
+    maps = np.arange(n)
+    explored = distances
+    layer = np.zeros(distances.shape, dtype=bool)
+    layer[maps, starts[:, 0], starts[:, 1]] = True
+    unexplored = distances == -2
+    distance = 0
+    while len(maps):
+        layer = expand_layer(explored, layer, unexplored, distance)
+
+        # A map is complete once its goal has been reached with a distance no larger than the layer just expanded.
+        goal_distance = explored[np.arange(len(maps)), goals[maps, 0], goals[maps, 1]]
+        layer[(goal_distance >= 0) & (goal_distance <= distance)] = False
+        active = layer.any(axis=(1, 2))
+        distance += 1
+
+        # Drops the complete maps once at least half of the stack is complete.
+        if active.sum() <= len(maps) // 2:
+            if explored is not distances:
+                distances[maps] = explored
+            maps, explored, layer, unexplored = maps[active], explored[active], layer[active], unexplored[active]
+
+    arrived = distances[np.arange(n), goals[:, 0], goals[:, 1]] >= 0
+    if not paths:
+        return distances, arrived
+    routes = [trace_path(distances[i], tuple(starts[i].tolist()), tuple(goals[i].tolist())) if arrived[i] else None for i in range(n)]
+    return distances, arrived, routes
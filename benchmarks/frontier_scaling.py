@@ -0,0 +1,61 @@
+"""Times complete explorations on increasingly large seeded maps, to show how the cost of a search scales with the
+number of squares. With a constant time frontier the time per explored square should stay roughly flat.
+
+Usage:
+    python benchmarks/frontier_scaling.py [--alg BFS] [--sizes 80 240 1024 4096] [--seed 0]
+"""
+import argparse, os, sys, time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solver import Adventurer, generate_map
+
+
+
+def seeded_map(size, seed):
+    """Creates a seeded size x size map with the start placed in the middle, in a cleared 3x3 area such that it isn't
+    enclosed, and the goal at a pole, so that most of the map is explored.
+
+    Returns:
+        NumPy array [size, size], (int, int), (int, int): the map, start and goal, see solver.generate_map.
+    """
+    grid, _, _ = generate_map(size, size, np.random.RandomState(seed))
+    start, goal = (size // 2, size // 2), (0, size - 1)
+    grid[start[0] - 1:start[0] + 2, start[1] - 1:start[1] + 2] = -2
+    grid[goal] = -2
+    grid[start] = 0
+    return grid, start, goal
+
+
+def time_search(size, alg, seed):
+    """Explores one seeded map until the search finishes, see seeded_map.
+
+    Returns:
+        (float, int): seconds taken and the number of squares expanded.
+    """
+    grid, start, goal = seeded_map(size, seed)
+    traveller = Adventurer(grid, start, goal, alg)
+    expanded = 0
+    began = time.perf_counter()
+    while not traveller.arrived and traveller.possible:
+        traveller.step_forward()
+        expanded += 1
+    return time.perf_counter() - began, expanded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alg", default="BFS", choices=["BFS", "DFS"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[80, 240, 1024, 4096])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'expanded':>10} {'seconds':>10} {'us/square':>10}")
+    for size in args.sizes:
+        seconds, expanded = time_search(size, args.alg, args.seed)
+        print(f"{size:>6} {expanded:>10} {seconds:>10.3f} {1e6 * seconds / expanded:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Times the hot paths of the solver and the renderer on seeded maps, writing the results as JSON such that runs of
+different versions can be compared. The renderer is run under the dummy SDL video driver, so no window is opened.
+
+Usage:
+    python benchmarks/run.py [--sizes 16 24 ... 240 480] [--seed 0] [--repeat 3] [--max-steps 200000]
+                            [--output results.json]
+"""
+import argparse, json, os, platform, sys, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1") # Keeps the JSON on standard output clean.
+
+import numpy as np
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+from main import Map, col_options, row_options, sphere_tiles
+from frontier_scaling import seeded_map
+from solver import Adventurer
+
+
+
+def best_time(function, repeat):
+    """Returns the shortest time in seconds taken by any of several calls of the function."""
+    times = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        function()
+        times += [time.perf_counter() - began]
+    return min(times)
+
+
+def bench_search(size, alg, seed, repeat, max_steps):
+    """Times step_forward until the search finishes, then backtrack on the explored map. As DFS visits squares again
+    whenever it finds a shorter route to them, it can take far more steps than there are squares, so the search is
+    stopped after max_steps, which are still the same steps on every run. Nodes are the squares popped, see
+    solver.SearchStats, which are the same on every run of the same map.
+    """
+    seconds, backtrack_seconds = [], []
+    for _ in range(repeat):
+        grid, start, goal = seeded_map(size, seed)
+        traveller = Adventurer(grid, start, goal, alg)
+        steps = 0
+        began = time.perf_counter()
+        while not traveller.arrived and traveller.possible and steps < max_steps:
+            traveller.step_forward()
+            steps += 1
+        seconds += [time.perf_counter() - began]
+        if traveller.arrived and traveller.possible:
+            backtrack_seconds += [best_time(lambda: traveller.backtrack(mark_path=False), 1)]
+
+    results = [{"name": "step_forward", "alg": alg, "col": size, "row": size, "seconds": min(seconds),
+                "steps": steps, "nodes": traveller.stats.popped, "nodes_per_sec": traveller.stats.popped / min(seconds),
+                "complete": traveller.arrived or not traveller.possible}]
+    if backtrack_seconds:
+        results += [{"name": "backtrack", "alg": alg, "col": size, "row": size, "seconds": min(backtrack_seconds),
+                     "path_length": int(grid[goal]) + 1}]
+    return results
+
+
+def bench_render(screen, size, seed, repeat):
+    """Times the creation of the sphere and full redraws of a seeded map in both views. The 3D redraws project the
+    sphere again each time, as after a rotation.
+    """
+    np.random.seed(seed)
+    map_to_explore = Map(screen, main.h, size, size)
+    Adventurer(map_to_explore.map, map_to_explore.start, map_to_explore.goal, "BFS").explore()
+
+    def draw_3d():
+        map_to_explore.projected = None
+        map_to_explore.draw_map()
+
+    results = []
+    for name, function in [("sphere_tiles", lambda: (sphere_tiles.cache_clear(), sphere_tiles(size, size, map_to_explore.radius))),
+                           ("create_tiles", map_to_explore.create_tiles)]:
+        seconds = best_time(function, repeat)
+        results += [{"name": name, "col": size, "row": size, "seconds": seconds}]
+    for view, function in [("2D", map_to_explore.draw_map), ("3D", draw_3d)]:
+        map_to_explore.view = view
+        seconds = best_time(function, repeat)
+        results += [{"name": "draw_map", "view": view, "col": size, "row": size, "seconds": seconds,
+                     "frames_per_sec": 1 / seconds}]
+    return results
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=sorted(set(row_options) | set(col_options) | {480}),
+                        help="side lengths of the square maps, default is every size offered by the UI and 480")
+    parser.add_argument("--algs", nargs="+", default=["BFS", "DFS"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs of each benchmark, the fastest is kept")
+    parser.add_argument("--max-steps", type=int, default=200000, help="steps after which a search is stopped")
+    parser.add_argument("--output", help="file the JSON results are written to, default is standard output")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((main.w, main.h))
+    results = []
+    for size in args.sizes:
+        for alg in args.algs:
+            results += bench_search(size, alg, args.seed, args.repeat, args.max_steps)
+        results += bench_render(screen, size, args.seed, args.repeat)
+        print(f"size {size} done", file=sys.stderr)
+    pygame.quit()
+
+    report = {"meta": {"python": platform.python_version(), "numpy": np.__version__, "pygame": pygame.version.ver,
+                       "platform": platform.platform(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                       "seed": args.seed, "repeat": args.repeat, "max_steps": args.max_steps},
+              "results": results}
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,147 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from connectivity import ConnectivityIndex
+from solver import trace_path
+from wavefront import wavefront_search
+
+
+
+def grid_key(grid):
+    """Hash of the shape and wall layout of a map, such that maps with the same walls share their cached distances
+    regardless of how far they have been explored.
+
+    Args:
+        grid (NumPy array [col, row]): map where walls are -1.
+
+    Returns:
+        String: hex digest identifying the map.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.array(grid.shape, dtype=np.int64).tobytes())
+    digest.update(np.packbits(grid == -1).tobytes())
+    return digest.hexdigest()
+
+
+def distance_field(grid, source):
+    """Finds the distance from the source to every square it is connected to, see wavefront.wavefront_search.
+
+    Args:
+        grid (NumPy array [col, row]): map where walls are -1, every other value is treated as an empty square. It is not modified.
+        source (int, int): square from which the distances are measured.
+
+    Returns:
+        NumPy int32 array [col, row]: walls as -1, squares which can't be reached as -2, otherwise the distance.
+    """
+    field = np.where(grid == -1, -1, -2).astype(np.int32)
+    field[source] = 0
+    wavefront_search(field, source)
+    return field
+
+
+class DistanceCache:
+    def __init__(self, max_bytes=256 * 2**20):
+        """Keeps the complete distance fields of recently used sources, such that repeated queries on the same map only
+        need to follow the distances back from the goal instead of exploring again. The least recently used fields
+        are dropped once their total size would exceed the budget.
+
+        Args:
+                max_bytes (int): memory budget for all the stored fields, default is 256 MiB.
+                """
+        self.max_bytes = max_bytes
+        # (map key, source) -> distance field, or (map key, "connectivity") -> ConnectivityIndex of the map, from least to
+        # most recently used.
+        self.fields = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.fields)
+
+    def lookup(self, key, source):
+        """Returns the stored distance field for the source on the map with the given key, or None if there isn't one."""
+        field = self.fields.get((key, source))
+        if field is not None:
+            self.fields.move_to_end((key, source))
+        return field
+
+    def store(self, key, source, field):
+        """Adds a distance field, dropping the least recently used ones until it fits within the budget. Fields larger
+        than the whole budget are not stored.
+        """
+        if field.nbytes > self.max_bytes:
+            return
+        if (key, source) in self.fields:
+            self.nbytes -= self.fields.pop((key, source)).nbytes
+        while self.nbytes + field.nbytes > self.max_bytes:
+            self.nbytes -= self.fields.popitem(last=False)[1].nbytes
+        self.fields[(key, source)] = field
+        self.nbytes += field.nbytes
+
+    def field(self, grid, source, key=None):
+        """Finds the distance field of the source, exploring the map only if it isn't already stored.
+
+        Args:
+            grid (NumPy array [col, row]): map where walls are -1. It is not modified.
+            source (int, int): square from which the distances are measured.
+            key (String): result of grid_key for the map, computed if not given.
+
+        Returns:
+            NumPy int32 array [col, row]: see distance_field. It is shared with the cache and should not be modified.
+        """
+        key = grid_key(grid) if key is None else key
+        field = self.lookup(key, source)
+        if field is None:
+            self.misses += 1
+            field = distance_field(grid, source)
+            self.store(key, source, field)
+        else:
+            self.hits += 1
+        return field
+
+    def connectivity(self, grid, key=None):
+        """Finds the regions of the map, see connectivity.ConnectivityIndex, building them only if they aren't stored.
+
+        Args:
+            grid (NumPy array [col, row]): map where walls are -1. It is not modified.
+            key (String): result of grid_key for the map, computed if not given.
+        """
+        key = grid_key(grid) if key is None else key
+        index = self.lookup(key, "connectivity")
+        if index is None:
+            index = ConnectivityIndex(grid)
+            self.store(key, "connectivity", index)
+        return index
+
+    def query(self, grid, start, goal, key=None):
+        """Finds the shortest path between two squares, reusing any stored field from either the start or the goal. As
+        every move can be made in both directions, a field from the goal gives the route in reverse. Otherwise the
+        regions of the map are checked first, so that no field is computed for squares which can't reach each other,
+        then the field of the start is computed and stored.
+
+        Args:
+            grid (NumPy array [col, row]): map where walls are -1. It is not modified.
+            start (int, int): where the route begins.
+            goal (int, int): the square to be reached.
+            key (String): result of grid_key for the map, computed if not given.
+
+        Returns:
+            int, List of (int, int) or None, None: the distance from start to goal and the route between them, see
+                trace_path, or None for both if the goal can't be reached.
+        """
+        key = grid_key(grid) if key is None else key
+        field = self.lookup(key, start)
+        reverse = False
+        if field is None and self.lookup(key, goal) is not None:
+            start, goal, reverse = goal, start, True
+        elif field is None and not self.connectivity(grid, key).reachable(start, goal):
+            return None, None
+        field = self.field(grid, start, key)
+
+        if field[goal] < 0:
+            return None, None
+        path = trace_path(field, start, goal)
+        return int(field[goal]), path[::-1] if reverse else path
@@ -0,0 +1,169 @@
+import numpy as np
+
+from solver import trace_path
+
+
+
+def distance_dtype(col, row):
+    """Chooses the narrowest unsigned type which can hold any distance on a map of this size, keeping its largest value
+    free to mark squares which haven't been reached.
+    """
+    return np.dtype(np.uint16) if col * row <= np.iinfo(np.uint16).max else np.dtype(np.uint32)
+
+
+def pack(mask):
+    """Packs a boolean map into 8 squares per byte along the rows, such that each column stays contiguous."""
+    return np.packbits(mask, axis=1)
+
+
+def packed_neighbours(packed):
+    """Finds every square adjacent to a square of a packed mask, see wavefront.neighbours. Moving along the rows shifts
+    the bits within each byte, carrying the bit at the edge over from the neighbouring byte. Bits moved into the padding
+    at the end of each column are not cleared, so the result should be combined with a mask whose padding is empty.
+
+    Args:
+        packed (NumPy uint8 array [col, ceil(row / 8)]).
+
+    Returns:
+        NumPy uint8 array [col, ceil(row / 8)].
+    """
+    near = np.roll(packed, 1, axis=0)
+    near |= np.roll(packed, -1, axis=0)
+    near |= packed >> 1 # From the square above, bits are ordered from the most significant.
+    near[:, 1:] |= packed[:, :-1] << 7
+    near |= packed << 1 # From the square below.
+    near[:, :-1] |= packed[:, 1:] >> 7
+    return near
+
+
+
+class CompactGrid:
+    def __init__(self, walls, row, start, goal, distances=None):
+        """Map stored with as little memory as possible: one bit per square for the walls, the narrowest possible type for
+        the distances, and one more bit per square for the route found, instead of an int64 per square holding all of them.
+
+        Args:
+                walls (NumPy uint8 array [col, ceil(row / 8)]): packed mask of the walls, see pack.
+                row (int): number of rows, which can't be recovered from the packed walls.
+                start (int, int): where the exploration begins.
+                goal (int, int): the square to be reached.
+                distances (NumPy array [col, row]): where the distances are written, such as a memory map. A new array
+                    of distance_dtype is created if not given, with every square unreached until the map is solved.
+                """
+        self.walls = walls
+        self.col = walls.shape[0]
+        self.row = row
+        self.start = start
+        self.goal = goal
+        if distances is None:
+            dtype = distance_dtype(self.col, row)
+            distances = np.full((self.col, row), np.iinfo(dtype).max, dtype=dtype)
+        self.distances = distances
+        self.unreached = np.iinfo(distances.dtype).max # Distance of every square which hasn't been reached, including walls.
+        self.path = np.zeros(walls.shape, dtype=np.uint8) # Packed mask of the squares on the route.
+        self.arrived = False
+        self.possible = True
+
+    @classmethod
+    def from_map(cls, grid, start, goal):
+        """Creates a compact copy of a map in the usual format, where walls are -1."""
+        return cls(pack(grid == -1), grid.shape[1], start, goal)
+
+    @classmethod
+    def generate(cls, col, row, rng=np.random, band=1024):
+        """Creates a new random map, producing the same map as solver.generate_map given the same random state. The
+        walls are generated a band of columns at a time, such that the full int64 map is never held in memory.
+
+        Args:
+            col (int): number of columns.
+            row (int): number of rows.
+            rng: source of randomness, see solver.generate_map.
+            band (int): number of columns generated at a time.
+        """
+        walls = np.empty((col, (row + 7) // 8), dtype=np.uint8)
+        for x in range(0, col, band):
+            walls[x:x + band] = pack(rng.randint(0, 3, (min(band, col - x), row)) == 0)
+        start = (rng.randint(col), rng.randint(row))
+        goal = (rng.randint(col), rng.randint(row))
+        grid = cls(walls, row, start, goal)
+        grid.set_wall(start, False)
+        grid.set_wall(goal, False)
+        return grid
+
+    @property
+    def nbytes(self):
+        return self.walls.nbytes + self.distances.nbytes + self.path.nbytes
+
+    def is_wall(self, square):
+        x, y = square
+        return bool(self.walls[x, y // 8] & (0x80 >> (y % 8)))
+
+    def set_wall(self, square, wall=True):
+        x, y = square
+        if wall:
+            self.walls[x, y // 8] |= 0x80 >> (y % 8)
+        else:
+            self.walls[x, y // 8] &= ~np.uint8(0x80 >> (y % 8))
+
+    def write_layer(self, packed, distance):
+        """Writes the distance of every square of a packed mask, only looking at the bytes which contain any square."""
+        width = self.walls.shape[1]
+        flat = np.flatnonzero(packed)
+        byte, bit = np.nonzero(np.unpackbits(packed.ravel()[flat][:, None], axis=1))
+        self.distances[flat[byte] // width, (flat[byte] % width) * 8 + bit] = distance
+
+    def solve(self):
+        """Explores the map one whole BFS layer at a time using packed masks, see wavefront.wavefront_search, producing
+        the same distances as the BFS of Adventurer for every square it reaches.
+
+        Returns:
+            Bool: if the goal was reached or not.
+        """
+        self.distances.fill(self.unreached)
+        self.path.fill(0)
+        self.distances[self.start] = 0
+
+        # Packed masks of the current layer, and of the squares which are neither walls nor explored yet.
+        layer = np.zeros(self.walls.shape, dtype=np.uint8)
+        layer[self.start[0], self.start[1] // 8] = 0x80 >> (self.start[1] % 8)
+        unexplored = ~self.walls & pack(np.ones((1, self.row), dtype=bool))
+        unexplored &= ~layer
+        distance = 0
+        while layer.any():
+            layer = packed_neighbours(layer)
+            layer &= unexplored
+            unexplored &= ~layer
+            self.write_layer(layer, distance + 1)
+            if self.distances[self.goal] <= distance:
+                break
+            distance += 1
+
+        self.arrived = bool(self.distances[self.goal] != self.unreached)
+        self.possible = self.arrived
+        return self.arrived
+
+    def backtrack(self):
+        """Finds the route from the start to the goal, see trace_path, and marks it in the packed path mask rather than
+        overwriting the distances.
+
+        Returns:
+            List of (int, int): the squares of the route, or None if the goal can't be reached.
+        """
+        if not self.arrived:
+            return None
+        squares_travelled = trace_path(self.distances, self.start, self.goal)
+        for x, y in squares_travelled:
+            self.path[x, y // 8] |= 0x80 >> (y % 8)
+        return squares_travelled
+
+    def to_map(self):
+        """Expands the map into the usual int64 format, with walls as -1, unexplored squares as -2 and the route as -3,
+        except for the start and goal which keep their distance.
+        """
+        grid = self.distances.astype(np.int64)
+        grid[grid == self.unreached] = -2
+        grid[np.unpackbits(self.walls, axis=1, count=self.row).astype(bool)] = -1
+        on_path = np.unpackbits(self.path, axis=1, count=self.row).astype(bool)
+        on_path[self.start] = on_path[self.goal] = False
+        grid[on_path] = -3
+        return grid
@@ -0,0 +1,77 @@
+import numpy as np
+
+
+
+def component_labels(grid):
+    """Labels the regions of a map, such that two squares can reach each other if and only if they share a label. Every
+    square starts as its own region, then on each pass every pair of adjacent squares in different regions hooks the
+    region with the larger label onto the smaller one, all at once with np.minimum.at, after which pointer jumping makes
+    every square point straight at the root of its region. Moves wrap horizontally but not across the poles, as in
+    solver.adjacent.
+
+    Args:
+        grid (NumPy array [col, row]): map where walls are -1, every other value is treated as an empty square.
+
+    Returns:
+        NumPy int32 array [col, row]: walls as -1, otherwise the label of the region, numbered from 0.
+    """
+    col, row = grid.shape
+    open_squares = (grid != -1).ravel()
+    index = np.arange(col * row).reshape(col, row)
+
+    # Pairs of adjacent empty squares, along the wrapping columns and then along the rows.
+    first = np.concatenate([index.ravel(), index[:, :-1].ravel()])
+    second = np.concatenate([np.roll(index, -1, axis=0).ravel(), index[:, 1:].ravel()])
+    both_open = open_squares[first] & open_squares[second]
+    first, second = first[both_open], second[both_open]
+
+    parent = np.arange(col * row)
+    while True:
+        a, b = parent[first], parent[second]
+        differ = a != b
+        if not differ.any():
+            break
+        # Pairs already in the same region stay so, and are not checked again.
+        first, second, a, b = first[differ], second[differ], a[differ], b[differ]
+        # Both are roots after pointer jumping, and a root only ever points at a smaller one, so no cycle can form.
+        np.minimum.at(parent, np.maximum(a, b), np.minimum(a, b))
+        while True:
+            jumped = parent[parent]
+            if (jumped == parent).all():
+                break
+            parent = jumped
+
+    labels = np.full(col * row, -1, dtype=np.int32)
+    labels[open_squares] = np.unique(parent[open_squares], return_inverse=True)[1]
+    return labels.reshape(col, row)
+
+
+
+class ConnectivityIndex:
+    def __init__(self, grid):
+        """Precomputed regions of a map, answering whether one square can reach another without exploring, see
+        component_labels. It only depends on the walls, so it stays valid however far the map has been explored.
+
+        Args:
+                grid (NumPy array [col, row]): map where walls are -1. It is not modified.
+                """
+        self.labels = component_labels(grid)
+        self.sizes = np.bincount(self.labels[self.labels >= 0]) # Number of squares in each region.
+
+    def __len__(self):
+        """Returns the number of regions."""
+        return len(self.sizes)
+
+    @property
+    def nbytes(self):
+        return self.labels.nbytes + self.sizes.nbytes
+
+    def reachable(self, start, goal):
+        """Returns if there is a route from start to goal, which is never the case if either of them is a wall."""
+        label = self.labels[start]
+        return bool(label >= 0 and label == self.labels[goal])
+
+    def region_size(self, square):
+        """Returns the number of squares which can be reached from the square, including itself, 0 for a wall."""
+        label = self.labels[square]
+        return int(self.sizes[label]) if label >= 0 else 0
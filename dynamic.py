@@ -0,0 +1,131 @@
+import heapq
+
+import numpy as np
+
+from cache import distance_field
+from solver import adjacent, trace_path
+
+
+
+class IncrementalField:
+    def __init__(self, grid, source, field=None):
+        """Keeps the complete distance field of a source up to date while walls are added and removed, repairing only
+        the squares whose distance actually changes instead of exploring the whole map again.
+
+        Args:
+                grid (NumPy array [col, row]): map where walls are -1, every other value is treated as an empty square. It is not modified.
+                source (int, int): square from which the distances are measured.
+                field (NumPy array [col, row]): already complete distance field of the source for this map, see
+                    cache.distance_field. It is computed if not given, otherwise it is updated in place.
+                """
+        self.field = distance_field(grid, source) if field is None else field
+        self.col, self.row = self.field.shape
+        self.source = source
+
+    def distance(self, goal):
+        """Returns the distance from the source to the goal, which is negative if it can't be reached."""
+        return int(self.field[goal])
+
+    def path(self, goal):
+        """Returns the route from the source to the goal, see trace_path, or None if the goal can't be reached."""
+        if self.field[goal] < 0:
+            return None
+        return trace_path(self.field, self.source, goal)
+
+    def relax(self, to_visit, changed):
+        """Lowers distances outwards from the squares waiting to be visited, in the same way as the modified DFS of
+        Adventurer: whenever the distance of a square improves it is visited again, so that its neighbours can improve too.
+
+        Args:
+            to_visit (List of (int, (int, int))): heap of squares, ordered by their distance.
+            changed (Set of (int, int)): updated in place with every square whose distance was improved.
+        """
+        while to_visit:
+            distance, square = heapq.heappop(to_visit)
+            if self.field[square] != distance:
+                continue
+            for near in adjacent(square, self.col, self.row):
+                if self.field[near] == -2 or self.field[near] > distance + 1:
+                    self.field[near] = distance + 1
+                    heapq.heappush(to_visit, (distance + 1, near))
+                    changed.add(near)
+
+    def reconnect(self, squares, changed):
+        """Gives each unexplored square the best distance through its explored neighbours, then lowers the distances
+        around them, see relax.
+        """
+        to_visit = []
+        for square in squares:
+            reached = [self.field[near] for near in adjacent(square, self.col, self.row) if self.field[near] >= 0]
+            if reached and self.field[square] == -2:
+                self.field[square] = min(reached) + 1
+                heapq.heappush(to_visit, (int(self.field[square]), square))
+                changed.add(square)
+        self.relax(to_visit, changed)
+
+    def remove_walls(self, squares):
+        """Turns walls into empty squares. Only the squares which become closer to the source are visited.
+
+        Args:
+            squares (List of (int, int)): the walls which are removed, any square which isn't a wall is ignored.
+
+        Returns:
+            Set of (int, int): every square whose distance changed.
+        """
+        opened = [square for square in squares if self.field[square] == -1]
+        for square in opened:
+            self.field[square] = -2
+        changed = set(opened)
+        if self.source in changed:
+            # Everything was unreachable while the source was a wall, so the distances spread from the source again.
+            self.field[self.source] = 0
+            self.relax([(0, self.source)], changed)
+        self.reconnect(opened, changed)
+        return changed
+
+    def add_walls(self, squares):
+        """Turns empty squares into walls. Squares are checked in order of their distance, and any square which no longer
+        has a neighbour one step closer to the source loses its distance, in turn checking the squares one step further
+        away. Only these squares are then given new distances from their remaining neighbours, see reconnect.
+
+        Args:
+            squares (List of (int, int)): the squares which become walls, any wall is ignored.
+
+        Returns:
+            Set of (int, int): every square whose distance changed.
+        """
+        closed = [square for square in squares if self.field[square] != -1]
+        changed = set(closed)
+        if self.source in changed:
+            # Without the source nothing can be reached anymore.
+            changed.update(zip(*np.nonzero(self.field >= 0)))
+            self.field[self.field >= 0] = -2
+            for square in closed:
+                self.field[square] = -1
+            return changed
+
+        to_check = []
+        for square in closed:
+            distance = self.field[square]
+            self.field[square] = -1
+            if distance >= 0:
+                for near in adjacent(square, self.col, self.row):
+                    if self.field[near] == distance + 1:
+                        heapq.heappush(to_check, (int(distance + 1), near))
+
+        lost = []
+        while to_check:
+            distance, square = heapq.heappop(to_check)
+            if self.field[square] != distance:
+                continue
+            if any(self.field[near] == distance - 1 for near in adjacent(square, self.col, self.row)):
+                continue
+            self.field[square] = -2
+            lost += [square]
+            for near in adjacent(square, self.col, self.row):
+                if self.field[near] == distance + 1:
+                    heapq.heappush(to_check, (distance + 1, near))
+
+        changed.update(lost)
+        self.reconnect(lost, changed)
+        return changed
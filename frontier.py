@@ -0,0 +1,73 @@
+from collections import deque
+
+import numpy as np
+
+
+
+class Frontier:
+    """Squares waiting to be explored, which can be taken from either end in constant time. Squares which are removed,
+    or pushed again after their distance improved, are only marked as stale in a per-square bitmap rather than searched
+    for, and are skipped once they reach either end of the queue.
+    """
+    def __init__(self, col, row, squares=()):
+        """Args:
+                col (int): number of columns of the map being explored.
+                row (int): number of rows of the map being explored.
+                squares (iterable of (int, int)): squares which are initially waiting to be explored.
+                """
+        self.queue = deque()
+        self.entry = np.zeros((col, row), dtype=np.int64) # Number of the live entry for each square, 0 if it isn't waiting.
+        self.pushed = 0 # Number of entries ever added, used to number them.
+        self.size = 0 # Number of live entries.
+        for square in squares:
+            self.push(square)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, square):
+        return self.entry[square] != 0
+
+    def __iter__(self):
+        """Iterates over the live squares, from first to last."""
+        for square, number in self.queue:
+            if self.entry[square] == number:
+                yield square
+
+    def push(self, square):
+        """Adds the square to the end of the queue, removing it from its previous position if it was already waiting."""
+        if self.entry[square] == 0:
+            self.size += 1
+        self.pushed += 1
+        self.entry[square] = self.pushed
+        self.queue.append((square, self.pushed))
+
+    def discard(self, square):
+        """Removes the square from the queue if it is waiting, otherwise does nothing.
+
+        Returns:
+            Bool: if the square was waiting or not.
+        """
+        if self.entry[square] == 0:
+            return False
+        self.entry[square] = 0
+        self.size -= 1
+        return True
+
+    def pop_first(self):
+        """Removes and returns the square which has been waiting the longest, as used by BFS."""
+        while True:
+            square, number = self.queue.popleft()
+            if self.entry[square] == number:
+                self.entry[square] = 0
+                self.size -= 1
+                return square
+
+    def pop_last(self):
+        """Removes and returns the square which was added most recently, as used by DFS."""
+        while True:
+            square, number = self.queue.pop()
+            if self.entry[square] == number:
+                self.entry[square] = 0
+                self.size -= 1
+                return square
@@ -0,0 +1,89 @@
+import numpy as np
+
+from cache import distance_field
+from connectivity import ConnectivityIndex
+
+
+
+def wrapped_manhattan_field(col, row, goal):
+    """Finds the distance from every square to the goal ignoring walls, see solver.wrapped_manhattan.
+
+    Returns:
+        NumPy int32 array [col, row].
+    """
+    x = np.abs(np.arange(col, dtype=np.int32) - goal[0])
+    y = np.abs(np.arange(row, dtype=np.int32) - goal[1])
+    return np.minimum(x, col - x)[:, None] + y[None, :]
+
+
+
+class LandmarkIndex:
+    def __init__(self, grid, count=4, connectivity=None):
+        """Distance fields from a few landmarks, giving lower bounds on the distance between any two squares of a map. As
+        the distance from a landmark can't change by more than the length of the route between two squares, the
+        difference of their distances from any landmark is a lower bound, and the largest over all landmarks is used.
+        Landmarks are chosen spread out: each is the square furthest from those chosen before, starting from the square
+        furthest from an arbitrary one, all within the largest region of the map.
+
+        Args:
+                grid (NumPy array [col, row]): map where walls are -1. It is not modified.
+                count (int): number of landmarks, each costs one distance field of memory.
+                connectivity (ConnectivityIndex): regions of the map, built if not given.
+                """
+        connectivity = ConnectivityIndex(grid) if connectivity is None else connectivity
+        self.col, self.row = grid.shape
+        self.landmarks = []
+        self.fields = np.empty((0, self.col, self.row), dtype=np.int32)
+        if not len(connectivity):
+            return
+
+        # Distances from the chosen landmarks, only ever -2 outside of the largest region.
+        region = np.argmax(connectivity.sizes)
+        spread = np.where(connectivity.labels == region, 0, -2)
+        spread[tuple(np.argwhere(connectivity.labels == region)[0])] = 1
+        fields = []
+        for _ in range(count):
+            landmark = np.unravel_index(np.argmax(spread), spread.shape)
+            if spread[landmark] <= 0 and fields:
+                break # Every square of the region is already a landmark.
+            field = distance_field(grid, landmark)
+            if not fields:
+                # The first square only serves to find a square at the edge of the region.
+                landmark = np.unravel_index(np.argmax(field), field.shape)
+                field = distance_field(grid, landmark)
+                spread = field
+            self.landmarks += [tuple(int(i) for i in landmark)]
+            fields += [field]
+            spread = np.minimum(spread, field)
+        self.fields = np.array(fields)
+
+    def __len__(self):
+        return len(self.landmarks)
+
+    @property
+    def nbytes(self):
+        return self.fields.nbytes
+
+    def lower_bound(self, start, goal):
+        """Returns a distance from start to goal which is never larger than the true one, see bounds."""
+        bound = 0
+        for field in self.fields:
+            if field[start] >= 0 and field[goal] >= 0:
+                bound = max(bound, abs(int(field[start]) - int(field[goal])))
+        x = abs(start[0] - goal[0])
+        return max(bound, min(x, self.col - x) + abs(start[1] - goal[1]))
+
+    def bounds(self, goal):
+        """Finds a lower bound on the distance from every square to the goal at once, the largest of the landmark bound
+        and of the distance ignoring walls, see wrapped_manhattan_field. Squares which the landmarks can't reach, or
+        any square if they can't reach the goal, only use the distance ignoring walls.
+
+        Returns:
+            NumPy int32 array [col, row]: suitable as an A* heuristic towards the goal, see solver.Adventurer.
+        """
+        bounds = wrapped_manhattan_field(self.col, self.row, goal)
+        if len(self) and self.fields[0][goal] >= 0:
+            reached = self.fields[0] >= 0
+            landmark_bound = np.abs(self.fields - self.fields[(slice(None),) + tuple(goal)][:, None, None]).max(axis=0)
+            bounds[reached] = np.maximum(bounds, landmark_bound)[reached]
+        return bounds
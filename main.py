@@ -1,103 +1,71 @@
-import pygame, sys, math
+import pygame, sys, math, time
+from functools import lru_cache
 import numpy as np
 
+from solver import ALGORITHMS, Adventurer, generate_map
+
 
 
 # Necessary global variables for the interactive UI.
 col, row = 80, 80
+row_options = [16, 24, 48, 60, 80, 120, 160, 240] # Sizes which can be chosen with the row_button and col_button.
+col_options = [16, 24, 48, 60, 80, 120, 160, 240]
 alg = "BFS"
+steps_per_frame = 1 # Number of exploration steps between frames, None for as many as fit in the frame budget.
+frame_budget = 1/60 # Longest time in seconds spent exploring between two frames.
 
 # Necessary PyGame variables and configuration.
 w,h = 1080, 720 # UI designed for w at least 160 larger than h. No issues with 640x480.
+stats_height = 22 * 7 # Height of the statistics at the top of the side panel, the buttons are placed below it.
 
-pygame.init()
-screen = pygame.display.set_mode((w,h))
-clock = pygame.time.Clock()
 
-pygame.mouse.set_visible(True)
-pygame.event.set_grab(False)
+    
+@lru_cache(maxsize=8)
+def sphere_tiles(row, col, radius):
+    """Creates the complete matrix of cartesian coordinates for each face of the unrotated 3D sphere, at once for every
+    face. It is cached since it only depends on the size of the map, and is read only so that it can be shared.
 
+    Returns:
+        NumPy matrix [row, col, 4, 3], see Map.create_tiles.
+    """
+    np_tiles = np.ones((row, col, 4, 3))
 
-    
-class Adventurer:
-    def __init__(self, map_to_explore, start, goal, alg_type):
-        self.map = map_to_explore
-        self.col = map_to_explore.shape[0]
-        self.row = map_to_explore.shape[1]
-        self.pos = start
-        self.start = start
-        self.goal = goal
-        self.to_visit = [start]
-        self.alg_type = alg_type
-        self.arrived = False # Tracks if the goal has been reached or not.
-        self.possible = True # Tracks if there remain squares to be explored.
-    
-    def backtrack(self):
-        """Finds which squares were travelled thorugh on the optimal route. Since each square is distance 1 from its neighbour,
-        the square which has a distance of 1 less than the current square is guaranteed to be on a valid path to the current 
-        square from the start. This process is started from the goal and repeated until the start is reached, while keeping
-        track of the squares traversed. These are also marked on the map as -3, such that they can be added to the graphical representation.
-        
-        Returns:
-            List of (int, int): each representing the (x, y) coordinates of one of the traversed squares.
-        """
-        self.pos = self.goal
-        squares_travelled = [self.goal]
-        x, y, = self.pos
-        while (x, y) != self.start:
-            for mov_x, mov_y in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
-                if self.map[(x+mov_x + self.col) % self.col][(y+mov_y + self.row) % self.row] == self.map[x][y] - 1:
-                    next_square = ((x+mov_x + self.col) % self.col, (y+mov_y + self.row) % self.row)
-                    
-            squares_travelled += [next_square]
-            # leaves the start and goal intact, such that the distance to the goal is saved.
-            if (x, y) != self.start and (x, y) != self.goal:
-                self.map[x][y] = -3 
-            x, y = next_square
-        return squares_travelled[::-1]
-            
-    def step_forward(self):
-        """Procedes with the path exploration until no possible square could lead to a better solution than the one already
-        found, or no square can be explored. Can use both BFS or DFS algorithm, modified such that they are able to find the 
-        shortest path from the start to the goal, and not just check if one exists or not.
-        """
-        # Was a path found or not once the map is explored.
-        if not self.to_visit: 
-            if self.map[self.goal[0]][self.goal[1]] == -2:
-                self.possible = False
-            else:
-                self.arrived = True
-            return [self.start]
-        
-        # Difference between BFS and DFS
-        if self.alg_type == "DFS":
-            self.pos = self.to_visit[-1]
-            self.to_visit.pop(len(self.to_visit) - 1)
-        if self.alg_type == "BFS":
-            self.pos = self.to_visit[0]
-            self.to_visit.pop(0)
-        
-        # Explores squares surrounding current position.
-        x, y = self.pos
-        new_squares = []
-        for mov_x, mov_y in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
-            # Due to it being a sphere, the map wraps horizontally, but not vertically (as that would imply travelling from one pole to the other).
-            if y + mov_y >= 0 and y + mov_y < self.row:
-                # Checks if the distance to the adjacent square can be improved, and if so marks it as needing to be checked.
-                # Unvisited squares are treated as if their distance from the start were infinity, thus any path is an improvement.
-                if self.map[(x+mov_x + self.col) % self.col][(y+mov_y + self.row) % self.row] == -2 or self.map[(x+mov_x + self.col) % self.col][(y+mov_y + self.row) % self.row] > self.map[x][y] + 1:
-                    if ((x+mov_x + self.col) % self.col, (y+mov_y + self.row) % self.row) in self.to_visit:
-                        self.to_visit.remove((((x+mov_x + self.col) % self.col, (y+mov_y + self.row) % self.row)))
-                    
-                    # Updates the map so that it now records the distance from the start to the new square via the current route.
-                    self.map[(x+mov_x + self.col) % self.col][(y+mov_y + self.row) % self.row] = self.map[x][y] + 1
-                    if self.map[self.goal[0]][self.goal[1]] == -2 or self.map[x][y] < self.map[self.goal[0]][self.goal[1]]: 
-                        self.to_visit += [((x+mov_x + self.col) % self.col, (y+mov_y + self.row) % self.row)]
-                    new_squares += [((x+mov_x + self.col) % self.col, (y+mov_y + self.row) % self.row)]
-                    
-        # returns all newly explored squares so that they can be updated in the graphical representation.
-        return new_squares
-    
+    # Latitude and longitute lines, the intersection of any two is the location of the vertex of a face.
+    h_ang = np.arange(col) * 2*math.pi / col
+    v_ang = np.arange(1, row) * math.pi / (row+1)
+    vertices = radius * np.stack([np.outer(np.cos(h_ang), np.sin(v_ang)),
+                                  np.broadcast_to(np.cos(v_ang), (col, row-1)),
+                                  np.outer(np.sin(h_ang), np.sin(v_ang))], axis=-1) # [col, row - 1, 3]
+    next_vertices = np.roll(vertices, -1, axis=0) # The vertices of the following longitude line, wrapping around.
+
+    # Faces connected with poles only have 3 vertexes, hence the fourth will remain (1, 1, 1).
+    np_tiles[0, :, 0] = radius * np.array([0, 1, 0])
+    np_tiles[0, :, 1] = vertices[:, 0]
+    np_tiles[0, :, 2] = next_vertices[:, 0]
+    np_tiles[row-1, :, 0] = radius * np.array([math.sin(math.pi), math.cos(math.pi), 0])
+    np_tiles[row-1, :, 1] = vertices[:, -1]
+    np_tiles[row-1, :, 2] = next_vertices[:, -1]
+
+    # All faces with 4 vertexes, between two consecutive latitude lines.
+    np_tiles[1:row-1, :, 0] = vertices[:, :-1].transpose(1, 0, 2)
+    np_tiles[1:row-1, :, 1] = vertices[:, 1:].transpose(1, 0, 2)
+    np_tiles[1:row-1, :, 2] = next_vertices[:, 1:].transpose(1, 0, 2)
+    np_tiles[1:row-1, :, 3] = next_vertices[:, :-1].transpose(1, 0, 2)
+
+    np_tiles.flags.writeable = False
+    return np_tiles
+
+
+
+@lru_cache(maxsize=None)
+def button_font(size):
+    return pygame.font.Font("freesansbold.ttf", size)
+
+
+@lru_cache(maxsize=256)
+def button_text(text, size, color):
+    """Renders the text of a button, which is cached as the same few texts are shown over and over."""
+    return button_font(size).render(text, True, color)
 
 
 
@@ -139,13 +107,12 @@ class Button:
         return False
     
     def update(self):
-        pygame.draw.rect(screen, self.color, (self.x0, self.y0, self.x, self.y))
-        buttonText = pygame.font.Font("freesansbold.ttf", self.y // 2)
-        textSurf = buttonText.render(self.text, True, self.text_color)
+        rect = pygame.draw.rect(self.screen, self.color, (self.x0, self.y0, self.x, self.y))
+        textSurf = button_text(self.text, self.y // 2, self.text_color)
         textRect = textSurf.get_rect()
         textRect.center = ((self.x0 + (self.x / 2)), (self.y0 + (self.y / 2)))
         self.screen.blit(textSurf, textRect)
-        pygame.display.update()
+        pygame.display.update(rect)
 
         
         
@@ -161,12 +128,17 @@ class Map:
         self.start = None
         self.goal = None
         self.map = None
+        self.goal_map = None # Distances from the goal while BFS-bi explores from both sides, see Adventurer.
         
         # Necessary variables for the 3D sphere view.
         self.radius = 2.5
         self.polar_ang = 0.0
         self.zenith_ang = 0.0
         self.tiles = None
+        self.polygons = None # Screen coordinates of every face, None for those facing away, see project_tiles.
+        self.visible_faces = None
+        self.projected = None # Size and rotation of the sphere the polygons were projected for.
+        self.dirty = [] # Areas of the screen which have been drawn on since the last call to flush().
         
         self.reset()
         
@@ -175,100 +147,126 @@ class Map:
         """Resets the map in preparation for the next cycle. Creates new random start, end and walls, then procedes to call
         the appropriate function for it to be drawn.
         """
-        self.map = np.random.randint(0, 3, (col, row)) # The 3 can be increased to decrease the density of walls.
-        self.map = np.where(self.map > 0, -2, -1) # Squares that contain a wall are set to -1, unexplored squares are set to -2.
-        np.transpose(self.map) # necessary such that x is along the columns and y is along the rows, while staying map[x][y].
-        
-        # Randomises start and goal positions, while ensuring neither are in the same location as a wall.
-        self.start = (np.random.randint(self.col), np.random.randint(self.row))
-        self.goal = (np.random.randint(self.col), np.random.randint(self.row))
-        self.map[self.start[0]][self.start[1]] = 0
-        self.map[self.goal[0]][self.goal[1]] = -2
+        self.map, self.start, self.goal = generate_map(self.col, self.row)
+        self.goal_map = None
         self.draw_map()
         
     
-    def pol_car(self, alpha, beta):
-        """Converts polar coordinates to their cartesian equivalents, while factoring in any rotation of the sphere
-        and its radius.
-        
-        Args:
-            alpha (float): the angle on the X-Z plane in radians.
-            beta (float): the zenith angle of the point from the X-Z plane.
-            
+    def rotation(self):
+        """Creates the matrix applying the rotation of the sphere: around its axis by the polar angle, then around the
+        horizontal axis of the screen by the zenith angle.
+
         Returns:
-            Numpy Array [x, y, z]: cartesian coordinates.
+            NumPy matrix [3, 3]: to be multiplied on the right of a row of cartesian coordinates.
         """
+        polar_matrix = [[math.cos(self.polar_ang), 0, math.sin(self.polar_ang)],
+                        [0, 1, 0],
+                        [-math.sin(self.polar_ang), 0, math.cos(self.polar_ang)]]
         rot_matrix = [[1, 0, 0], 
                       [0, math.cos(self.zenith_ang), -math.sin(self.zenith_ang)], 
                       [0, math.sin(self.zenith_ang), math.cos(self.zenith_ang)]]
-        
-        x = math.cos(alpha)*math.sin(beta)
-        y = math.cos(beta)
-        z = math.sin(alpha)*math.sin(beta)
-        return np.matmul(np.array([x, y, z])*self.radius, rot_matrix)
+        return np.matmul(polar_matrix, rot_matrix)
         
         
     def create_tiles(self):
-        """Creates the complete matrix of catesian coordinates for each face in the 3D sphere. 
-        These are calculated from their associated polar coordinates before being converted.
+        """Creates the complete matrix of catesian coordinates for each face in the 3D sphere, by applying the current
+        rotation to the cached unrotated sphere in a single matrix multiplication.
         
         Returns:
             NumPy matrix [row, col, 4, 3] which contains the cartesian coordinates of each vertex for each
                 face on the sphere. Some of these faces only have 3 vertexes, in which case the coordinates of the 
                 fourth are (1, 1, 1)
         """
-        np_tiles = np.ones((self.row, self.col, 4, 3))
-        
-        # Produces lists of polar angles that will be needed. These can be though of as latitude and longitute lines,
-        # and the intersection of any two is the location of the vertex of a face.
-        h_ang = [(x * 2*math.pi / self.col + self.polar_ang) % (2*math.pi) for x in range(self.col)]
-        h_ang += [h_ang[0]]
-        v_ang = [y*math.pi/(self.row+1) for y in range(1, self.row)]
-        
-        # Create faces connected with poles, these only have 3 vertexes, hence the fourth will remain (1, 1, 1).
-        for i in range(self.col):
-            np_tiles[0][i][0] = self.pol_car(0, 0)
-            np_tiles[0][i][1] = self.pol_car(h_ang[i], v_ang[0])
-            np_tiles[0][i][2] = self.pol_car(h_ang[(i+1)%self.col], v_ang[0])
-            
-            np_tiles[self.row-1][i][0] = self.pol_car(0, math.pi)
-            np_tiles[self.row-1][i][1] = self.pol_car(h_ang[i], v_ang[-1])
-            np_tiles[self.row-1][i][2] = self.pol_car(h_ang[(i+1)%col], v_ang[-1])
-            
-        # Creates all faces with 4 vertexes.
-        for i, (x0, x1) in enumerate(zip(h_ang, h_ang[1:])):
-            for ii, (y0, y1) in enumerate(zip(v_ang, v_ang[1:])):
-                np_tiles[ii+1][i][0] = self.pol_car(x0, y0)
-                np_tiles[ii+1][i][1] = self.pol_car(x0, y1)
-                np_tiles[ii+1][i][2] = self.pol_car(x1, y1)
-                np_tiles[ii+1][i][3] = self.pol_car(x1, y0)
-                
+        np_tiles = np.matmul(sphere_tiles(self.row, self.col, self.radius), self.rotation())
+        np_tiles[0, :, 3] = np_tiles[self.row-1, :, 3] = 1 # The filler vertexes are not rotated.
         return np_tiles   
     
         
+    def project_tiles(self):
+        """Converts every face of the sphere from 3D cartesian coordinates to 2D coordinates on the screen at once,
+        simulating depth via a vanishing point at the center of the gamescreen. Faces facing away from the screen are
+        culled. The result only changes when the sphere is rotated or resized, so it is kept until then.
+        """
+        if self.projected == (self.row, self.col, self.polar_ang, self.zenith_ang):
+            return
+        self.tiles = self.create_tiles()
+        depth = self.tiles[..., 2:] + 3
+        screen_tiles = self.map_side/2 + self.tiles[..., :2]*self.map_side/(2*depth)
+        visible = self.tiles[..., 2].min(axis=-1) >= -0.15/self.radius
+
+        # Doesn't include the filler vertexes for the 3 sides faces, connected with the poles.
+        # Faces are listed by column then row, the same order in which the whole map is drawn.
+        self.polygons = [[None] * self.col for _ in range(self.row)]
+        self.visible_faces = [tuple(face) for face in np.argwhere(visible.T).tolist()]
+        vertexes = screen_tiles.transpose(1, 0, 2, 3)[visible.T].tolist()
+        for (x, y), face in zip(self.visible_faces, vertexes):
+            self.polygons[y][x] = [tuple(point) for point in (face[:3] if y == 0 or y == self.row-1 else face)]
+        self.projected = (self.row, self.col, self.polar_ang, self.zenith_ang)
+        
+        
+    def tile_color(self, x, y):
+        """Chooses the color of a tile based on its contents.
+        
+        Returns:
+            (int, int, int): tuple for RGB values.
+        """
+        if (x, y) == self.start: # Will always be colored green.
+            return (0, 255, 0)
+        elif (x, y) == self.goal: # Will always be colored red.
+            return (255, 0, 0)
+        elif self.map[x][y] == -1: # Wall colored white.
+            return (255, 255, 255)
+        elif self.map[x][y] == -2 and self.goal_map is not None and self.goal_map[x][y] >= 0:
+            # Only reached from the goal by BFS-bi, colored based on the distance from the goal.
+            return (max(255 - self.goal_map[x][y]*(240//self.row), 63), 0, 0)
+        elif self.map[x][y] == -2: # Unexplored squares colored black.
+            return (0, 0, 0)
+        elif self.map[x][y] == -3: # Squares part of the shortest path colored yellow.
+            return (255, 255, 0)
+        else: # Explored squares colored based on their distance from the start.
+            return (0, 0, max(255 - self.map[x][y]*(240//self.row), 63))
+        
+    def tile_colors(self):
+        """Chooses the color of every tile at once, in the same way as tile_color.
+        
+        Returns:
+            NumPy uint8 array [col, row, 3]: RGB values of each tile.
+        """
+        colors = np.zeros((self.col, self.row, 3), dtype=np.uint8) # Unexplored squares colored black.
+        colors[..., 2] = np.maximum(255 - self.map*(240//self.row), 63) # Explored squares colored based on their distance.
+        colors[self.map == -2] = (0, 0, 0)
+        if self.goal_map is not None:
+            from_goal = (self.map == -2) & (self.goal_map >= 0)
+            colors[from_goal, 0] = np.maximum(255 - self.goal_map[from_goal]*(240//self.row), 63)
+        colors[self.map == -1] = (255, 255, 255)
+        colors[self.map == -3] = (255, 255, 0)
+        colors[self.start] = (0, 255, 0)
+        colors[self.goal] = (255, 0, 0)
+        return colors
+        
+        
     def draw_map(self):
         """Completely resets the view of the map, redrawing every tile based on its contents and the current view style.
         """
-        pygame.draw.rect(self.screen, (0, 0, 0), (0, 0, self.map_side, self.map_side))
+        background = pygame.draw.rect(self.screen, (0, 0, 0), (0, 0, self.map_side, self.map_side))
         
-        # Creates the matrix of cartesian coordinates for the sphere only when they are needed.
+        # Only the faces of the sphere which are visible need to be drawn.
         if self.view == "3D":
-            self.tiles = self.create_tiles()
-            
-        for x in range(self.col):
-            for y in range(self.row):
-                if (x, y) == self.start: # Will always be colored green.
-                    self.update_tile(x, y, (0, 255, 0))
-                elif (x, y) == self.goal: # Will always be colored red.
-                    self.update_tile(x, y, (255, 0, 0))
-                elif self.map[x][y] == -1: # Wall colored white.
-                    self.update_tile(x, y, (255, 255, 255))
-                elif self.map[x][y] == -2: # Unexplored squares colored black.
-                    self.update_tile(x, y, (0, 0, 0))
-                elif self.map[x][y] == -3: # Squares part of the shortest path colored yellow.
-                    self.update_tile(x, y, (255, 255, 0))
-                else: # Explored squares colored based on their distance from the start.
-                    self.update_tile(x, y, (0, 0, max(255 - self.map[x][y]*(240//self.row), 63)))
+            self.project_tiles()
+            for x, y in self.visible_faces:
+                self.update_tile(x, y, self.tile_color(x, y))
+        elif self.view == "2D":
+            # One pixel per tile, stretched over the whole map in a single blit.
+            surface = pygame.surfarray.make_surface(self.tile_colors())
+            self.screen.blit(pygame.transform.scale(surface, (self.map_side, self.map_side)), (0, 0))
+        self.dirty = [background]
+        
+        
+    def flush(self):
+        """Updates only the areas of the screen which have been drawn on since the last call.
+        """
+        pygame.display.update(self.dirty)
+        self.dirty = []
                 
                 
                 
@@ -289,14 +287,11 @@ class Map:
             if direction == "LEFT":
                 self.polar_ang = (self.polar_ang + 3*math.pi/2.0) % (2*math.pi)
 
-            self.create_tiles()
             self.draw_map()
-            pygame.display.update()
     
     def update_tile(self, x0, y0, color):
-        """Redraws the tile at (x0, y0) of the map, using the correct color. If the current view is 3D, it applies the
-        conversion from 3D cartesian coordinates to 2D coordinates on the screen, simulating depth via a vanishing point
-        at the center of the gamescreen.
+        """Redraws the tile at (x0, y0) of the map, using the correct color. If the current view is 3D, it uses the
+        polygon projected onto the screen by project_tiles, and is skipped if the face is culled.
         
         Args: 
             x0 (int): can range from 0 to self.col - 1.
@@ -304,16 +299,11 @@ class Map:
             color (int, int, int): tuple for RGB values, each from 0 to 255.
         """
         if self.view == "3D":
-            vert_2d = []
-            if min(self.tiles[y0][x0][:, 2]) >= -0.15/self.radius:
-                for (x, y, z) in self.tiles[y0][x0]:
-                    # Doesn't include the filler vertexes for the 3 sides faces.
-                    if x != 1 or y != 1 or z != 1:
-                        z += 3
-                        vert_2d += [(self.map_side/2 + x*self.map_side/(2*z), self.map_side/2 + y*self.map_side/(2*z))]
-                pygame.draw.polygon(self.screen, color, vert_2d)
+            polygon = self.polygons[y0][x0]
+            if polygon:
+                self.dirty += [pygame.draw.polygon(self.screen, color, polygon)]
         elif self.view == "2D":
-            pygame.draw.rect(self.screen, color, (x0*self.map_side/self.col, y0*self.map_side/self.row, self.map_side/self.col, self.map_side/self.row))
+            self.dirty += [pygame.draw.rect(self.screen, color, (x0*self.map_side/self.col, y0*self.map_side/self.row, self.map_side/self.col, self.map_side/self.row))]
        
             
 
@@ -343,7 +333,6 @@ def increment_row():
     """
     global row
     global row_button
-    row_options = [16, 24, 48, 60, 80, 120, 160, 240]
     row = row_options[(row_options.index(row)+1) % len(row_options)]
     row_button.text = ("Rows: " + str(row))
     
@@ -353,7 +342,6 @@ def increment_col():
     """
     global col
     global col_button
-    col_options = [16, 24, 48, 60, 80, 120, 160, 240]
     col = col_options[(col_options.index(col)+1) % len(col_options)]
     col_button.text = ("Cols: " + str(col))
 
@@ -377,16 +365,49 @@ def swap_alg_type():
      """
     global alg
     global alg_type_button
-    if alg == "BFS": alg = "DFS"
-    else: alg = "BFS"
+    alg = ALGORITHMS[(ALGORITHMS.index(alg)+1) % len(ALGORITHMS)]
     alg_type_button.text = alg
     
 
+def increment_speed():
+    """Executed when the user clicks on the speed_button, keeps track of the options for the number of exploration 
+    steps taken between frames. It then updates the button text.
+    """
+    global steps_per_frame
+    global speed_button
+    speed_options = [1, 10, 100, 1000, None]
+    steps_per_frame = speed_options[(speed_options.index(steps_per_frame)+1) % len(speed_options)]
+    speed_button.text = speed_text()
+
+
+def speed_text():
+    return "Speed: " + ("Max" if steps_per_frame is None else str(steps_per_frame))
+    
+
+
+def draw_stats(stats):
+    """Shows the counters of the current search at the top of the side panel, see solver.SearchStats.
+    """
+    lines = [stats.alg_type + " statistics",
+             "Popped: " + str(stats.popped),
+             "Relaxations: " + str(stats.relaxations),
+             "Frontier peak: " + str(stats.frontier_peak),
+             "Frontier removals: " + str(stats.removals)]
+    lines += ["Search: %.3f s" % stats.search_time]
+    if stats.backtrack_time is not None:
+        lines += ["Backtrack: %.1f ms" % (1000 * stats.backtrack_time)]
+
+    panel = pygame.draw.rect(screen, (0, 0, 0), (h + 10, 20, w - h - 20, stats_height))
+    for i, line in enumerate(lines):
+        screen.blit(button_font(16).render(line, True, (255, 255, 255)), (h + 10, 20 + 22 * i))
+    pygame.display.update(panel)
+
 
 def wait():
     """Pauses the program, while still allowing for the user to interact with UI elements.
     """
     while True:
+        map_to_explore.flush()
         for event in pygame.event.get():
             if event.type == pygame.QUIT: pygame.quit(); sys.exit()
             if event.type == pygame.KEYDOWN:
@@ -410,89 +431,107 @@ def wait():
         
                     
 
-# UI configuration.
-screen.fill((0, 0, 0))
+if __name__ == "__main__":
+    # Necessary PyGame variables and configuration, only set up when run as the interactive UI.
+    pygame.init()
+    screen = pygame.display.set_mode((w,h))
+    clock = pygame.time.Clock()
+
+    pygame.mouse.set_visible(True)
+    pygame.event.set_grab(False)
 
-status_button =   Button(screen, h + 10, h - 320, 140, 40, (180, 255, 0), "Searching", None)
-row_button =      Button(screen, h + 10, h - 240, 140, 40, (0, 255, 255), ("Rows: " + str(row)), increment_row)
-col_button =      Button(screen, h + 10, h - 180, 140, 40, (0, 255, 255), ("Cols: " + str(col)), increment_col)
-map_type_button = Button(screen, h + 10, h - 120, 140, 40, (0, 255, 255), "3D Map", swap_map_type)
-alg_type_button = Button(screen, h + 10, h - 60, 140, 40, (0, 255, 255), str(alg), swap_alg_type)
+    # UI configuration.
+    screen.fill((0, 0, 0))
 
-buttons = [row_button, col_button, map_type_button, alg_type_button]
+    # The buttons are stacked up from the bottom, closer together on small windows such that they stay below the statistics.
+    spacing = min(60, (h - 60 - (stats_height + 30)) // 5)
+    status_button =   Button(screen, h + 10, h - 60 - 5 * spacing, 140, 40, (180, 255, 0), "Searching", None)
+    speed_button =    Button(screen, h + 10, h - 60 - 4 * spacing, 140, 40, (0, 255, 255), speed_text(), increment_speed)
+    row_button =      Button(screen, h + 10, h - 60 - 3 * spacing, 140, 40, (0, 255, 255), ("Rows: " + str(row)), increment_row)
+    col_button =      Button(screen, h + 10, h - 60 - 2 * spacing, 140, 40, (0, 255, 255), ("Cols: " + str(col)), increment_col)
+    map_type_button = Button(screen, h + 10, h - 60 - spacing, 140, 40, (0, 255, 255), "3D Map", swap_map_type)
+    alg_type_button = Button(screen, h + 10, h - 60, 140, 40, (0, 255, 255), str(alg), swap_alg_type)
 
+    buttons = [speed_button, row_button, col_button, map_type_button, alg_type_button]
+    pygame.display.update()
 
-# Create the first instances ready for the process to begin.
-map_to_explore = Map(screen, h, row, col)
-traveller = Adventurer(map_to_explore.map, map_to_explore.start, map_to_explore.goal, alg)
 
-# Game loop, which will not be exited until the program is closed.
-while True:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT: pygame.quit(); sys.exit()
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE: pygame.quit(), sys.exit()
-            if event.key == pygame.K_SPACE:
-                status_button.text = "Paused"
-                status_button.color = (255, 165, 0)
-                status_button.update()
-                wait()
-                status_button.text = "Searching"
-                status_button.color = (180, 255, 0)
-                status_button.update()
-            if map_to_explore.view == "3D":
-                if event.key == pygame.K_UP:
-                    map_to_explore.rotate_sphere("UP")
-                if event.key == pygame.K_DOWN:
-                    map_to_explore.rotate_sphere("DOWN")
-                if event.key == pygame.K_LEFT:
-                    map_to_explore.rotate_sphere("LEFT")
-                if event.key == pygame.K_RIGHT:
-                    map_to_explore.rotate_sphere("RIGHT")
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_pressed(buttons, mouse_pos)
-        if event.type == pygame.MOUSEBUTTONUP:
-            mouse_released(buttons)
+    # Create the first instances ready for the process to begin.
+    map_to_explore = Map(screen, h, row, col)
+    traveller = Adventurer(map_to_explore.map, map_to_explore.start, map_to_explore.goal, alg)
+    map_to_explore.goal_map = traveller.goal_map if alg == "BFS-bi" else None
+
+    # Game loop, which will not be exited until the program is closed.
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT: pygame.quit(); sys.exit()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE: pygame.quit(), sys.exit()
+                if event.key == pygame.K_SPACE:
+                    status_button.text = "Paused"
+                    status_button.color = (255, 165, 0)
+                    status_button.update()
+                    wait()
+                    status_button.text = "Searching"
+                    status_button.color = (180, 255, 0)
+                    status_button.update()
+                if map_to_explore.view == "3D":
+                    if event.key == pygame.K_UP:
+                        map_to_explore.rotate_sphere("UP")
+                    if event.key == pygame.K_DOWN:
+                        map_to_explore.rotate_sphere("DOWN")
+                    if event.key == pygame.K_LEFT:
+                        map_to_explore.rotate_sphere("LEFT")
+                    if event.key == pygame.K_RIGHT:
+                        map_to_explore.rotate_sphere("RIGHT")
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_pos = pygame.mouse.get_pos()
+                mouse_pressed(buttons, mouse_pos)
+            if event.type == pygame.MOUSEBUTTONUP:
+                mouse_released(buttons)
         
 
-    if traveller.arrived == False and traveller.possible == True: # Has not yet determined if the goal can be reached.
-        # Continue exploration.
-        new_squares = traveller.step_forward()
-        if new_squares:
-            for x, y in new_squares:
-                if (x, y) != map_to_explore.start and (x, y) != map_to_explore.goal:
-                    map_to_explore.update_tile(x, y, (0, 0, max(255 - map_to_explore.map[x][y]*(240//row), 63)))
-    else:
-        # Exploration complete.
-        if traveller.possible == False: # No valid route was found.
-            status_button.text = "No Path"
-            status_button.color = (255, 0, 0)
-            status_button.update()
-        else:
-            # A valid route was found and will be highlighted in yellow.
-            travelled_squares = traveller.backtrack()
-            if travelled_squares:
-                for x, y in travelled_squares:
+        if traveller.arrived == False and traveller.possible == True: # Has not yet determined if the goal can be reached.
+            # Continue exploration, for a number of steps or until the time for this frame runs out.
+            new_squares = traveller.step_batch(steps_per_frame, time.perf_counter() + frame_budget)
+            if new_squares:
+                for x, y in new_squares:
                     if (x, y) != map_to_explore.start and (x, y) != map_to_explore.goal:
-                        map_to_explore.update_tile(x, y, (255, 255, 0))
+                        map_to_explore.update_tile(x, y, map_to_explore.tile_color(x, y))
+            draw_stats(traveller.stats)
+        else:
+            # Exploration complete.
+            if traveller.possible == False: # No valid route was found.
+                status_button.text = "No Path"
+                status_button.color = (255, 0, 0)
+                status_button.update()
+            else:
+                # A valid route was found and will be highlighted in yellow.
+                travelled_squares = traveller.backtrack()
+                if travelled_squares:
+                    for x, y in travelled_squares:
+                        if (x, y) != map_to_explore.start and (x, y) != map_to_explore.goal:
+                            map_to_explore.update_tile(x, y, (255, 255, 0))
                         
-            # Display distance from start to goal.
-            status_button.text = ("Distance: " + str(map_to_explore.map[map_to_explore.goal[0]][map_to_explore.goal[1]]))
-            status_button.color = (0, 255, 0)
-            status_button.update()
+                # Display distance from start to goal.
+                status_button.text = ("Distance: " + str(map_to_explore.map[map_to_explore.goal[0]][map_to_explore.goal[1]]))
+                status_button.color = (0, 255, 0)
+                status_button.update()
             
-        wait()
+            draw_stats(traveller.stats)
+            map_to_explore.flush()
+            wait()
         
-        # Reset environment and UI for next exploration.
-        status_button.text = "Searching"
-        status_button.color = (180, 255, 0)
-        status_button.update()
+            # Reset environment and UI for next exploration.
+            status_button.text = "Searching"
+            status_button.color = (180, 255, 0)
+            status_button.update()
         
-        map_to_explore.row = row
-        map_to_explore.col = col
-        map_to_explore.reset()
+            map_to_explore.row = row
+            map_to_explore.col = col
+            map_to_explore.reset()
 
-        traveller = Adventurer(map_to_explore.map, map_to_explore.start, map_to_explore.goal, alg)
+            traveller = Adventurer(map_to_explore.map, map_to_explore.start, map_to_explore.goal, alg)
+            map_to_explore.goal_map = traveller.goal_map if alg == "BFS-bi" else None
         
-    pygame.display.update()
+        map_to_explore.flush()
@@ -0,0 +1,149 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from solver import generate_map, solve
+
+
+
+# Views of the shared maps and distances, set up in each worker by _attach_worker.
+_grids = None
+_distances = None
+_memory = []
+
+
+def task_rng(seed, index):
+    """Creates the source of randomness for one task, which only depends on the seed of the run and the index of the
+    task, such that any map can be reproduced regardless of which worker created it or in which order.
+
+    Args:
+        seed (int): seed of the whole run.
+        index (int): index of the task.
+
+    Returns:
+        np.random.RandomState: with the same randint interface as np.random, as used by solver.generate_map.
+    """
+    return np.random.RandomState(np.random.SeedSequence(seed, spawn_key=(index,)).generate_state(4))
+
+
+def _attach(name, shape):
+    """Opens an existing block of shared memory as an int64 array. The workers share the resource tracker of the process
+    which created the block, so it is still only unlinked once, by SolvePool.close.
+    """
+    memory = shared_memory.SharedMemory(name)
+    _memory.append(memory)
+    return np.ndarray(shape, dtype=np.int64, buffer=memory.buf)
+
+
+def _attach_worker(grids_name, distances_name, shape):
+    global _grids, _distances
+    _grids = _attach(grids_name, shape)
+    _distances = _attach(distances_name, shape)
+
+
+def _chunks(items, chunksize):
+    return [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+
+
+def _generate_chunk(task):
+    indices, seed = task
+    squares = []
+    col, row = _grids.shape[1:]
+    for i in indices:
+        _grids[i], start, goal = generate_map(col, row, task_rng(seed, i))
+        squares += [(i, start, goal)]
+    return squares
+
+
+def _solve_chunk(task):
+    tasks, alg = task
+    routes = []
+    for i, start, goal in tasks:
+        _distances[i], path = solve(_grids[i], start, goal, alg)
+        routes += [(i, path)]
+    return routes
+
+
+
+class SolvePool:
+    def __init__(self, n, col, row, processes=None):
+        """Solves many maps of the same shape using several processes. The maps, and the distances found when exploring
+        them, are kept in shared memory so that only indices and coordinates are sent between processes.
+
+        Args:
+                n (int): number of maps.
+                col (int): number of columns of each map.
+                row (int): number of rows of each map.
+                processes (int): number of worker processes, default is one per core.
+                """
+        shape = (n, col, row)
+        size = max(n * col * row * np.dtype(np.int64).itemsize, 1)
+        self.grids_memory = shared_memory.SharedMemory(create=True, size=size)
+        self.distances_memory = shared_memory.SharedMemory(create=True, size=size)
+        self.grids = np.ndarray(shape, dtype=np.int64, buffer=self.grids_memory.buf) # Maps in the same format as solver.generate_map.
+        self.distances = np.ndarray(shape, dtype=np.int64, buffer=self.distances_memory.buf) # Explored maps, see solver.solve.
+        try:
+            self.pool = multiprocessing.Pool(processes, _attach_worker, (self.grids_memory.name, self.distances_memory.name, shape))
+        except BaseException:
+            self.free()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Stops the workers and frees the shared memory, after which the maps and distances can no longer be used. Closing
+        it again does nothing.
+        """
+        self.pool.terminate()
+        self.pool.join()
+        self.free()
+
+    def free(self):
+        """Frees the shared memory, once no worker can use it anymore. Freeing it again does nothing."""
+        if self.grids is None:
+            return
+        self.grids = self.distances = None # The views must go before the memory can be closed.
+        for memory in (self.grids_memory, self.distances_memory):
+            memory.close()
+            memory.unlink()
+
+    def generate(self, seed, chunksize=16):
+        """Fills every map with a new random map, see solver.generate_map. Each map is created from its own seed, see
+        task_rng, such that the same seed always produces the same maps.
+
+        Args:
+            seed (int): seed of the whole run.
+            chunksize (int): number of maps created by a worker at a time.
+
+        Returns:
+            List of (int, int), List of (int, int): start and goal of each map.
+        """
+        starts = [None] * len(self.grids)
+        goals = [None] * len(self.grids)
+        for squares in self.pool.imap_unordered(_generate_chunk, [(chunk, seed) for chunk in _chunks(range(len(self.grids)), chunksize)]):
+            for i, start, goal in squares:
+                starts[i], goals[i] = start, goal
+        return starts, goals
+
+    def solve(self, starts, goals, alg="BFS", chunksize=16):
+        """Finds the shortest path on every map, streaming the routes back as soon as each chunk of maps is solved. The
+        explored maps are written into self.distances, see solver.solve.
+
+        Args:
+            starts (List of (int, int)): where the exploration begins on each map.
+            goals (List of (int, int)): the square to be reached on each map.
+            alg (String): the algorithm used, as accepted by Adventurer.
+            chunksize (int): number of maps solved by a worker at a time.
+
+        Yields:
+            int, List of (int, int) or None: index of the map, and its route from start to goal, which is None if the
+                goal can't be reached. These arrive in the order the maps are solved, not their index order.
+        """
+        tasks = [(i, tuple(starts[i]), tuple(goals[i])) for i in range(len(self.grids))]
+        for routes in self.pool.imap_unordered(_solve_chunk, [(chunk, alg) for chunk in _chunks(tasks, chunksize)]):
+            yield from routes
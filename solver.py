@@ -0,0 +1,569 @@
+import heapq, time
+from collections import deque
+
+import numpy as np
+
+from frontier import Frontier
+from wavefront import expand_layer
+
+
+
+# Moves to the four adjacent squares, in the order in which they are explored.
+MOVES = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+
+# Algorithms accepted by Adventurer, in the order in which the UI cycles through them.
+ALGORITHMS = ["BFS", "DFS", "BFS-vec", "A*", "BFS-bi"]
+
+
+
+def generate_map(col, row, rng=np.random):
+    """Creates a new random map, along with a start and goal, ready to be explored.
+
+    Args:
+        col (int): number of columns, the map wraps horizontally along this axis.
+        row (int): number of rows, from one pole to the other.
+        rng: source of randomness, anything with the same randint interface as np.random (such as a np.random.RandomState).
+
+    Returns:
+        NumPy array [col, row], (int, int), (int, int): the map, with walls as -1, unexplored squares as -2 and
+            the start as 0, followed by the start and goal coordinates.
+    """
+    grid = rng.randint(0, 3, (col, row)) # The 3 can be increased to decrease the density of walls.
+    grid = np.where(grid > 0, -2, -1) # Squares that contain a wall are set to -1, unexplored squares are set to -2.
+
+    # Randomises start and goal positions, while ensuring neither are in the same location as a wall.
+    start = (rng.randint(col), rng.randint(row))
+    goal = (rng.randint(col), rng.randint(row))
+    grid[goal[0]][goal[1]] = -2
+    grid[start[0]][start[1]] = 0
+    return grid, start, goal
+
+
+def adjacent(square, col, row):
+    """Finds the squares which can be reached in one move, the map wraps horizontally but not vertically.
+
+    Returns:
+        List of (int, int): the adjacent squares, in the same order as MOVES.
+    """
+    x, y = square
+    return [((x + mov_x) % col, y + mov_y) for mov_x, mov_y in MOVES if 0 <= y + mov_y < row]
+
+
+def wrapped_manhattan(square, goal, col):
+    """Lower bound of the distance between two squares, used as the A* heuristic. Along the columns the shorter way
+    around the sphere is taken, as the map wraps horizontally.
+
+    Returns:
+        int: the number of moves needed if there were no walls.
+    """
+    dx = abs(square[0] - goal[0])
+    return min(dx, col - dx) + abs(square[1] - goal[1])
+
+
+def trace_path(grid, start, goal):
+    """Finds which squares were travelled through on the optimal route, without modifying the map. Since each square is
+    distance 1 from its neighbour, the square which has a distance of 1 less than the current square is guaranteed to be
+    on a valid path to the current square from the start. This process is started from the goal and repeated until the start is reached.
+
+    Args:
+        grid (NumPy array [col, row]): explored map, holding the distance from the start for each visited square.
+        start (int, int): where the exploration began.
+        goal (int, int): a square which has already been reached.
+
+    Returns:
+        List of (int, int): each representing the (x, y) coordinates of one of the traversed squares, from start to goal.
+    """
+    col, row = grid.shape
+    squares_travelled = [goal]
+    x, y = goal
+    while (x, y) != start:
+        for mov_x, mov_y in MOVES:
+            # The route cannot cross the poles, in the same way as the exploration.
+            if 0 <= y + mov_y < row and grid[(x + mov_x) % col][y + mov_y] == grid[x][y] - 1:
+                next_square = ((x + mov_x) % col, y + mov_y)
+        squares_travelled += [next_square]
+        x, y = next_square
+    return squares_travelled[::-1]
+
+
+def solve(grid, start, goal, alg="BFS", connectivity=None, landmarks=None):
+    """Finds the shortest path between two squares without any graphical representation.
+
+    Args:
+        grid (NumPy array [col, row]): map where walls are -1, every other value is treated as an empty square. It is not modified.
+        start (int, int): where the exploration begins.
+        goal (int, int): the square to be reached.
+        alg (String): the algorithm used, as accepted by Adventurer.
+        connectivity (ConnectivityIndex): regions of the map, see Adventurer. Maps queried several times can reuse one.
+        landmarks (LandmarkIndex): lower bounds used by A*, see Adventurer. Maps queried several times can reuse one.
+
+    Returns:
+        NumPy array [col, row], List of (int, int) or None: the explored map, holding the distance from the start for
+            each visited square, and the route from start to goal, which is None if the goal can't be reached.
+    """
+    explored = np.where(grid == -1, -1, -2)
+    explored[start[0]][start[1]] = 0
+
+    traveller = Adventurer(explored, start, goal, alg, connectivity=connectivity, landmarks=landmarks)
+    traveller.explore()
+
+    if not traveller.arrived:
+        return explored, None
+    return explored, traveller.backtrack(mark_path=False)
+
+
+
+class SearchStats:
+    def __init__(self, alg_type):
+        """Counters describing how much work a search did, kept by Adventurer as it explores. Only counts are updated
+        while stepping, the clock is read around each batch of steps and around backtrack.
+
+        Args:
+                alg_type (String): the algorithm used, as accepted by Adventurer.
+                """
+        self.alg_type = alg_type
+        self.steps = 0 # Number of calls to step_forward.
+        self.popped = 0 # Number of squares whose neighbours have been explored.
+        self.relaxations = 0 # Number of times the distance of an already reached square was improved.
+        self.frontier_peak = 0 # Largest number of squares waiting to be explored at the end of any step.
+        self.removals = 0 # Number of squares taken out of the frontier because their distance improved while waiting.
+        self.search_time = 0.0 # Seconds spent stepping in Adventurer.explore and Adventurer.step_batch, summed.
+        self.backtrack_time = None # Seconds taken by the last backtrack.
+
+    def as_dict(self):
+        """Returns the counters and times as a dictionary, such that they can be serialized, for instance as JSON."""
+        stats = {name: value for name, value in vars(self).items()}
+        stats["nodes_per_sec"] = self.popped / self.search_time if self.search_time else None
+        return stats
+
+
+
+class Adventurer:
+    def __init__(self, map_to_explore, start, goal, alg_type, trace=None, trace_every=1, connectivity=None, landmarks=None):
+        """Explores a map one step at a time, see step_forward.
+
+        Args:
+                map_to_explore (NumPy array [col, row]): map where walls are -1, unexplored squares -2 and the start 0. The
+                    distances found are written into it.
+                start (int, int): where the exploration begins.
+                goal (int, int): the square to be reached.
+                alg_type (String): one of "BFS", "DFS", "BFS-vec", "A*" or "BFS-bi".
+                trace (function): called as trace(adventurer, new_squares) after every trace_every steps, for
+                    instance to record how the search progresses. No work is done for it when it is None.
+                trace_every (int): how often trace is called, in steps.
+                connectivity (ConnectivityIndex): regions of the map, see connectivity.ConnectivityIndex. If given and the
+                    goal is in another region than the start, the search is complete without exploring anything.
+                landmarks (LandmarkIndex): if given, A* uses its lower bounds towards the goal as the heuristic, see
+                    landmarks.LandmarkIndex.bounds, instead of only wrapped_manhattan.
+                """
+        if alg_type not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {alg_type!r}, expected one of {', '.join(ALGORITHMS)}")
+        self.map = map_to_explore
+        self.col = map_to_explore.shape[0]
+        self.row = map_to_explore.shape[1]
+        self.pos = start
+        self.start = start
+        self.goal = goal
+        self.to_visit = Frontier(self.col, self.row, [start])
+        self.alg_type = alg_type
+        self.arrived = False # Tracks if the goal has been reached or not.
+        self.possible = True # Tracks if there remain squares to be explored.
+        self.stats = SearchStats(alg_type)
+        self.trace = trace
+        self.trace_every = trace_every
+
+        # BFS-vec explores a whole layer of squares at once, which are tracked as masks of the map instead.
+        if alg_type == "BFS-vec":
+            self.layer = np.zeros(self.map.shape, dtype=bool)
+            self.layer[start] = True
+            self.unexplored = self.map == -2
+            self.depth = self.map[start]
+
+        # A* keeps a heap ordered by distance from the start plus the heuristic, preferring the squares furthest from
+        # the start on ties. Squares whose distance has since improved are skipped when popped.
+        if alg_type == "A*":
+            self.heuristic = None if landmarks is None else landmarks.bounds(goal) # Lower bound from every square, if known.
+            self.to_visit = [(self.estimate(start), 0, start)]
+
+        # BFS-bi also explores from the goal, with its own map of distances from the goal, one whole layer at a time.
+        if alg_type == "BFS-bi":
+            self.to_visit = deque([start])
+            self.goal_map = np.where(self.map == -1, -1, -2)
+            self.goal_map[goal] = 0
+            self.goal_to_visit = deque([goal] if self.map[goal] != -1 else [])
+            self.side = None # Which side the current layer belongs to, either "start" or "goal".
+            self.layer_left = 0 # Number of squares of the current layer which have not been expanded yet.
+            self.best = 0 if start == goal else None # Shortest distance found through a square reached from both sides.
+            self.meet = start # Square through which the shortest distance was found.
+
+        if connectivity is not None and not connectivity.reachable(start, goal):
+            self.finish()
+
+    @property
+    def expanded(self):
+        """Number of squares whose neighbours have been explored, see SearchStats.popped."""
+        return self.stats.popped
+
+    def backtrack(self, mark_path=True):
+        """Finds which squares were travelled thorugh on the optimal route, see trace_path. The squares on the route are
+        also marked on the map as -3, such that they can be added to the graphical representation.
+
+        Args:
+            mark_path (Bool): if the route should be written into the map, default is True.
+
+        Returns:
+            List of (int, int): each representing the (x, y) coordinates of one of the traversed squares.
+        """
+        began = time.perf_counter()
+        self.pos = self.goal
+        squares_travelled = trace_path(self.map, self.start, self.goal)
+        if mark_path:
+            # leaves the start and goal intact, such that the distance to the goal is saved.
+            for x, y in squares_travelled[1:-1]:
+                self.map[x][y] = -3
+        self.stats.backtrack_time = time.perf_counter() - began
+        return squares_travelled
+
+    def explore(self):
+        """Continues the exploration until it is complete, without keeping track of the newly explored squares.
+        """
+        began = time.perf_counter()
+        while not self.arrived and self.possible:
+            if self.alg_type == "BFS-vec" and self.trace is None:
+                self.advance_layer()
+            else:
+                self.step_forward()
+        self.stats.search_time += time.perf_counter() - began
+
+    def step_batch(self, steps=None, until=None):
+        """Takes several steps at once, see step_forward, adding the time they took to the search time. Callers which
+        step the search themselves, such as the UI between frames, should use it rather than step_forward so that only
+        the time spent exploring is counted, reading the clock once per batch.
+
+        Args:
+            steps (int): largest number of steps taken, no limit if None.
+            until (float): time.perf_counter() value after which no more steps are taken, no limit if None.
+
+        Returns:
+            List of (int, int): the squares returned by every step taken, in order.
+        """
+        new_squares = []
+        taken = 0
+        began = time.perf_counter()
+        while not self.arrived and self.possible and (steps is None or taken < steps):
+            new_squares += self.step_forward()
+            taken += 1
+            if until is not None and time.perf_counter() > until:
+                break
+        self.stats.search_time += time.perf_counter() - began
+        return new_squares
+
+    def events(self, batch=None, mark_path=True):
+        """Explores the map lazily, yielding what happens as it happens, such that the caller can take events at its own
+        pace instead of calling step_forward and checking arrived and possible itself. Each event is a (kind, square) tuple:
+            ("expanded", square): the neighbours of the square are being explored.
+            ("relaxed", square): the distance of the square was set or improved, see step_forward.
+            ("goal", goal): the goal was reached, the exploration is complete.
+            ("path", square): one square of the route, from start to goal, see backtrack.
+        If the goal can't be reached, the events simply end after the last square is explored.
+
+        Args:
+            batch (int): if given, events are yielded in lists of up to this many instead of one at a time.
+            mark_path (Bool): if the route should be written into the map, see backtrack.
+
+        Yields:
+            (String, (int, int)) or List of (String, (int, int)).
+        """
+        if batch is not None:
+            pending = []
+            for event in self.events(None, mark_path):
+                pending.append(event)
+                if len(pending) == batch:
+                    yield pending
+                    pending = []
+            if pending:
+                yield pending
+            return
+
+        while not self.arrived and self.possible:
+            layer = self.layer if self.alg_type == "BFS-vec" else None # Replaced, not modified, by the step.
+            new_squares = self.step_forward()
+            if self.arrived or not self.possible:
+                break # Only the start is returned once the exploration is complete.
+            if layer is None:
+                yield ("expanded", self.pos)
+            else:
+                for x, y in np.argwhere(layer).tolist():
+                    yield ("expanded", (x, y))
+            for square in new_squares:
+                yield ("relaxed", square)
+
+        if self.arrived:
+            yield ("goal", self.goal)
+            for square in self.backtrack(mark_path):
+                yield ("path", square)
+
+    def checkpoint(self, file):
+        """Saves the whole state of the search, such that it can be resumed later or in another process, see restore.
+        The trace function and landmarks are not saved, only whether A* was using landmarks, as they must be given again.
+
+        Args:
+            file (String or file): where the state is written with np.savez, which adds ".npz" to a path without it.
+        """
+        stats = self.stats
+        state = {"map": self.map, "start": self.start, "goal": self.goal, "pos": self.pos,
+                 "alg_type": self.alg_type, "done": (self.arrived, self.possible),
+                 "counters": (stats.steps, stats.popped, stats.relaxations, stats.frontier_peak, stats.removals),
+                 # Time spent searching so far, and the time of the last backtrack, NaN until known.
+                 "times": (stats.search_time,
+                           np.nan if stats.backtrack_time is None else stats.backtrack_time)}
+        if self.alg_type == "BFS-vec":
+            state.update(layer=self.layer, unexplored=self.unexplored, depth=self.depth)
+        elif self.alg_type == "A*":
+            # The heap is saved in its own order, which is still a valid heap once loaded.
+            state["to_visit"] = np.array([(f, g, x, y) for f, g, (x, y) in self.to_visit], dtype=np.int64).reshape(-1, 4)
+            state["landmarks"] = self.heuristic is not None
+        elif self.alg_type == "BFS-bi":
+            state.update(to_visit=np.array(list(self.to_visit), dtype=np.int64).reshape(-1, 2),
+                         goal_map=self.goal_map,
+                         goal_to_visit=np.array(list(self.goal_to_visit), dtype=np.int64).reshape(-1, 2),
+                         side=self.side or "", layer_left=self.layer_left,
+                         best=-1 if self.best is None else self.best, meet=self.meet)
+        else:
+            # Only the live squares of the frontier, in order, such that stale entries are dropped.
+            state["to_visit"] = np.array(list(self.to_visit), dtype=np.int64).reshape(-1, 2)
+        np.savez(file, **state)
+
+    @classmethod
+    def restore(cls, file, trace=None, trace_every=1, landmarks=None):
+        """Resumes a search saved by checkpoint, which then continues exactly as it would have.
+
+        Args:
+            file (String or file): the saved state.
+            trace (function): see Adventurer.
+            trace_every (int): see Adventurer.
+            landmarks (LandmarkIndex): see Adventurer. Required if, and only if, the saved A* search was using landmarks,
+                as its heuristic must stay the same to continue in the same way.
+
+        Returns:
+            Adventurer: exploring the saved map, which is loaded into memory.
+        """
+        with np.load(file) as state:
+            if "landmarks" in state and bool(state["landmarks"]) != (landmarks is not None):
+                raise ValueError("the saved A* search " + ("used" if state["landmarks"] else "did not use")
+                                 + " landmarks, which must be given in the same way to restore it")
+            squares = lambda name: [tuple(square) for square in state[name].tolist()]
+            start, goal = tuple(state["start"].tolist()), tuple(state["goal"].tolist())
+            traveller = cls(state["map"], start, goal, str(state["alg_type"]), trace, trace_every, landmarks=landmarks)
+            traveller.pos = tuple(state["pos"].tolist())
+            traveller.arrived, traveller.possible = (bool(flag) for flag in state["done"])
+
+            stats = traveller.stats
+            stats.steps, stats.popped, stats.relaxations, stats.frontier_peak, stats.removals = state["counters"].tolist()
+            stats.search_time, backtrack_time = state["times"].tolist()
+            stats.backtrack_time = None if np.isnan(backtrack_time) else backtrack_time
+
+            if traveller.alg_type == "BFS-vec":
+                traveller.layer, traveller.unexplored = state["layer"], state["unexplored"]
+                traveller.depth = state["depth"][()]
+            elif traveller.alg_type == "A*":
+                traveller.to_visit = [(f, g, (x, y)) for f, g, x, y in state["to_visit"].tolist()]
+            elif traveller.alg_type == "BFS-bi":
+                traveller.to_visit = deque(squares("to_visit"))
+                traveller.goal_map = state["goal_map"]
+                traveller.goal_to_visit = deque(squares("goal_to_visit"))
+                traveller.side = str(state["side"]) or None
+                traveller.layer_left = int(state["layer_left"])
+                traveller.best = None if state["best"] == -1 else int(state["best"])
+                traveller.meet = tuple(state["meet"].tolist())
+            else:
+                traveller.to_visit = Frontier(traveller.col, traveller.row, squares("to_visit"))
+        return traveller
+
+    def finish(self):
+        """Records if a path was found or not once the map is explored.
+
+        Returns:
+            List of (int, int): only the start, in the same way as step_forward.
+        """
+        # A goal which is still unexplored, or is a wall, can't be reached.
+        if self.map[self.goal[0]][self.goal[1]] < 0:
+            self.possible = False
+        else:
+            self.arrived = True
+        return [self.start]
+
+    def advance_layer(self):
+        """Explores every square next to the current layer at once, see wavefront.expand_layer. The newly explored
+        squares become the next layer, unless the goal has already been reached with a distance no larger than the
+        current layer, matching when BFS stops adding squares to be visited.
+
+        Returns:
+            NumPy bool array [col, row] or None: the newly explored squares, None if the exploration is complete.
+        """
+        if not self.layer.any():
+            self.finish()
+            return None
+
+        layer_size = int(np.count_nonzero(self.layer))
+        self.stats.popped += layer_size
+        self.stats.frontier_peak = max(self.stats.frontier_peak, layer_size)
+        new = expand_layer(self.map, self.layer, self.unexplored, self.depth)
+        self.layer = new
+        if 0 <= self.map[self.goal] <= self.depth:
+            self.layer = np.zeros(new.shape, dtype=bool)
+        self.depth += 1
+        return new
+
+    def step_layer(self):
+        """Takes one step of BFS-vec, see advance_layer.
+
+        Returns:
+            List of (int, int): all newly explored squares, or only the start once the exploration is complete.
+        """
+        new = self.advance_layer()
+        if new is None:
+            return [self.start]
+        return [tuple(square) for square in np.argwhere(new).tolist()]
+
+    def estimate(self, square):
+        """Returns the A* heuristic of the square, a lower bound of its distance to the goal."""
+        if self.heuristic is None:
+            return wrapped_manhattan(square, self.goal, self.col)
+        return int(self.heuristic[square])
+
+    def step_astar(self):
+        """Expands the square with the lowest distance from the start plus heuristic, see estimate. As the
+        heuristic never overestimates, the distance of the goal is the shortest possible once it is the next square to
+        be expanded, and the exploration stops there.
+
+        Returns:
+            List of (int, int): all squares whose distance was improved, or only the start once the exploration is complete.
+        """
+        # Discards squares whose distance has improved since they were added.
+        while self.to_visit and self.map[self.to_visit[0][2]] != -self.to_visit[0][1]:
+            heapq.heappop(self.to_visit)
+        if not self.to_visit or self.to_visit[0][2] == self.goal:
+            return self.finish()
+
+        _, negative_distance, self.pos = heapq.heappop(self.to_visit)
+        distance = 1 - negative_distance
+        self.stats.popped += 1
+        new_squares = []
+        for square in adjacent(self.pos, self.col, self.row):
+            previous = self.map[square]
+            if previous == -2 or previous > distance:
+                if previous != -2:
+                    self.stats.relaxations += 1
+                self.map[square] = distance
+                heapq.heappush(self.to_visit, (distance + self.estimate(square), -distance, square))
+                new_squares += [square]
+        # Includes the entries which have gone stale but are still in the heap.
+        self.stats.frontier_peak = max(self.stats.frontier_peak, len(self.to_visit))
+        return new_squares
+
+    def step_bidirectional(self):
+        """Expands one square of the current layer of either side, choosing the side with the fewest squares waiting
+        whenever a layer is complete. Once a square has been reached from both sides, the layer is completed such that
+        the shortest distance through any such square is found, then the route from the meeting square to the goal is
+        written into the map so that it can be backtracked in the same way as BFS.
+
+        Returns:
+            List of (int, int): all newly explored squares from either side, or only the start once the exploration is complete.
+        """
+        if self.layer_left == 0:
+            if self.best is not None:
+                # Distances from the start along the route to the goal, following the distances from the goal down to 0.
+                square = self.meet
+                while square != self.goal:
+                    square = [near for near in adjacent(square, self.col, self.row) if self.goal_map[near] == self.goal_map[square] - 1][0]
+                    self.map[square] = self.best - self.goal_map[square]
+                return self.finish()
+            if not self.to_visit or not self.goal_to_visit:
+                return self.finish()
+            self.side = "start" if len(self.to_visit) <= len(self.goal_to_visit) else "goal"
+            self.layer_left = len(self.to_visit) if self.side == "start" else len(self.goal_to_visit)
+
+        if self.side == "start":
+            own_map, other_map, to_visit = self.map, self.goal_map, self.to_visit
+        else:
+            own_map, other_map, to_visit = self.goal_map, self.map, self.goal_to_visit
+        self.pos = to_visit.popleft()
+        self.layer_left -= 1
+        self.stats.popped += 1
+
+        distance = own_map[self.pos] + 1
+        new_squares = []
+        for square in adjacent(self.pos, self.col, self.row):
+            if own_map[square] == -2:
+                own_map[square] = distance
+                to_visit.append(square)
+                new_squares += [square]
+                if other_map[square] >= 0 and (self.best is None or distance + other_map[square] < self.best):
+                    self.best = distance + other_map[square]
+                    self.meet = square
+        self.stats.frontier_peak = max(self.stats.frontier_peak, len(self.to_visit) + len(self.goal_to_visit))
+        return new_squares
+
+    def step_forward(self):
+        """Takes one step of the exploration with the chosen algorithm, calling the trace function if it is due.
+
+        Returns:
+            List of (int, int): all newly explored squares, or only the start once the exploration is complete.
+        """
+        if self.alg_type == "BFS-vec":
+            new_squares = self.step_layer()
+        elif self.alg_type == "A*":
+            new_squares = self.step_astar()
+        elif self.alg_type == "BFS-bi":
+            new_squares = self.step_bidirectional()
+        else:
+            new_squares = self.step_search()
+
+        self.stats.steps += 1
+        if self.trace is not None and self.stats.steps % self.trace_every == 0:
+            self.trace(self, new_squares)
+        return new_squares
+
+    def step_search(self):
+        """Procedes with the path exploration until no possible square could lead to a better solution than the one already
+        found, or no square can be explored. Can use both BFS or DFS algorithm, modified such that they are able to find the
+        shortest path from the start to the goal, and not just check if one exists or not.
+        """
+        if not self.to_visit:
+            return self.finish()
+
+        # Difference between BFS and DFS
+        if self.alg_type == "DFS":
+            self.pos = self.to_visit.pop_last()
+        if self.alg_type == "BFS":
+            self.pos = self.to_visit.pop_first()
+        self.stats.popped += 1
+
+        # Explores squares surrounding current position.
+        x, y = self.pos
+        distance = self.map[x, y] + 1
+        new_squares = []
+        for mov_x, mov_y in MOVES:
+            # Due to it being a sphere, the map wraps horizontally, but not vertically (as that would imply travelling from one pole to the other).
+            if 0 <= y + mov_y < self.row:
+                square = ((x + mov_x) % self.col, y + mov_y)
+                # Checks if the distance to the adjacent square can be improved, and if so marks it as needing to be checked.
+                # Unvisited squares are treated as if their distance from the start were infinity, thus any path is an improvement.
+                previous = self.map[square]
+                if previous == -2 or previous > distance:
+                    if previous != -2:
+                        self.stats.relaxations += 1
+                        if self.to_visit.discard(square):
+                            self.stats.removals += 1
+
+                    # Updates the map so that it now records the distance from the start to the new square via the current route.
+                    self.map[square] = distance
+                    goal_distance = self.map[self.goal]
+                    if goal_distance == -2 or distance - 1 < goal_distance:
+                        self.to_visit.push(square)
+                    new_squares += [square]
+
+        self.stats.frontier_peak = max(self.stats.frontier_peak, len(self.to_visit))
+        # returns all newly explored squares so that they can be updated in the graphical representation.
+        return new_squares
@@ -0,0 +1,126 @@
+"""Map files, which can be opened as memory maps such that maps larger than the available memory can still be explored.
+
+All values are little endian. The file starts with a 64 byte header:
+
+    offset  type       field
+    0       8 bytes    magic, b"BFSGRID\\0"
+    8       uint32     format version, currently 1
+    12      uint32     col, number of columns
+    16      uint32     row, number of rows
+    20      uint32 x2  start (x, y)
+    28      uint32 x2  goal (x, y)
+    36      uint32     size in bytes of each distance, 0 if the file holds no distances, otherwise 2 or 4
+    40      24 bytes   reserved, zero
+
+followed by the walls at offset 64, as col x ceil(row / 8) bytes: the packed mask of compact.pack, one column after
+the other, with the first square of each byte in its most significant bit and the padding at the end of each column
+set to 0. If the file holds distances, they follow at the next multiple of 64 bytes as a col x row array of unsigned
+integers, one column after the other, where the largest value of the type marks squares which haven't been reached.
+"""
+import os
+
+import numpy as np
+
+from compact import CompactGrid, distance_dtype
+
+
+
+MAGIC = b"BFSGRID\0"
+VERSION = 1
+HEADER = np.dtype([("magic", "V8"), ("version", "<u4"), ("col", "<u4"), ("row", "<u4"), ("start", "<u4", 2),
+                   ("goal", "<u4", 2), ("distance_size", "<u4"), ("reserved", "V24")])
+
+
+def layout(col, row):
+    """Returns the offset and shape of the walls and of the distances in a map file."""
+    walls_shape = (col, (row + 7) // 8)
+    distances_offset = -(-(HEADER.itemsize + walls_shape[0] * walls_shape[1]) // 64) * 64
+    return HEADER.itemsize, walls_shape, distances_offset, (col, row)
+
+
+def save_grid(path, grid, distances=True):
+    """Writes a compact map to a file.
+
+    Args:
+        path (String): file to be written, replacing any existing file.
+        grid (CompactGrid): the map, see compact.CompactGrid.from_map to save a map in the usual format.
+        distances (Bool): if the distances of the map should also be saved, default is True. The distances of a map
+            which hasn't been solved are all saved as unreached.
+    """
+    saved = create_grid(path, grid.col, grid.row, grid.start, grid.goal, distances, grid.distances.dtype)
+    saved.walls[:] = grid.walls
+    saved.walls.flush()
+    if distances:
+        saved.distances[:] = grid.distances
+        saved.distances.flush()
+
+
+def create_grid(path, col, row, start, goal, distances=True, dtype=None):
+    """Creates a new map file with no walls, and opens it, see open_grid.
+
+    Args:
+        path (String): file to be written, replacing any existing file.
+        col (int): number of columns.
+        row (int): number of rows.
+        start (int, int): where the exploration begins.
+        goal (int, int): the square to be reached.
+        distances (Bool): if the file should hold the distances, default is True.
+        dtype: unsigned type of the distances, default is compact.distance_dtype.
+
+    Returns:
+        CompactGrid: backed by the new file, with every square unreached.
+    """
+    if dtype is None:
+        dtype = distance_dtype(col, row)
+    distance_size = np.dtype(dtype).itemsize if distances else 0
+    walls_offset, walls_shape, distances_offset, distances_shape = layout(col, row)
+
+    header = np.zeros((), dtype=HEADER)
+    header["magic"], header["version"] = np.void(MAGIC), VERSION
+    header["col"], header["row"] = col, row
+    header["start"], header["goal"] = start, goal
+    header["distance_size"] = distance_size
+    with open(path, "wb") as file:
+        file.write(header.tobytes())
+        file.truncate(distances_offset + col * row * distance_size)
+    grid = open_grid(path, "r+")
+    if distances:
+        grid.distances.fill(grid.unreached)
+        grid.distances.flush()
+    return grid
+
+
+def open_grid(path, mode="r+"):
+    """Opens a map file without reading it into memory, see the module documentation for the format. The walls, and the
+    distances if the file holds them, are memory maps of the file, such that exploring the map writes the distances back
+    into it.
+
+    Args:
+        path (String): the map file.
+        mode (String): "r+" to allow changes to be written back, or "r" to open it read only, as for np.memmap.
+            A read only file can still be explored if it holds no distances, which are then kept in memory.
+
+    Returns:
+        CompactGrid: backed by the file.
+    """
+    header = np.fromfile(path, dtype=HEADER, count=1)
+    if len(header) == 0 or bytes(header[0]["magic"]) != MAGIC:
+        raise ValueError(f"{path} is not a map file")
+    header = header[0]
+    if header["version"] != VERSION:
+        raise ValueError(f"{path} uses map file version {header['version']}, only version {VERSION} is supported")
+
+    col, row, distance_size = int(header["col"]), int(header["row"]), int(header["distance_size"])
+    start, goal = tuple(header["start"].tolist()), tuple(header["goal"].tolist())
+    walls_offset, walls_shape, distances_offset, distances_shape = layout(col, row)
+    # Checked before mapping anything, as np.memmap would extend a short file with zeros rather than fail.
+    end = distances_offset + col * row * distance_size if distance_size else walls_offset + walls_shape[0] * walls_shape[1]
+    if (distance_size not in (0, 2, 4) or os.path.getsize(path) < end
+            or not all(x < col and y < row for x, y in (start, goal))):
+        raise ValueError(f"{path} is not a map file")
+
+    walls = np.memmap(path, dtype=np.uint8, mode=mode, offset=walls_offset, shape=walls_shape)
+    distances = None
+    if distance_size:
+        distances = np.memmap(path, dtype=f"<u{distance_size}", mode=mode, offset=distances_offset, shape=distances_shape)
+    return CompactGrid(walls, row, start, goal, distances)
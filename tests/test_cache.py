@@ -0,0 +1,70 @@
+import numpy as np
+
+from cache import DistanceCache, distance_field, grid_key
+from solver import MOVES, generate_map, solve
+
+
+
+def seeded_maps(count, seed):
+    rng = np.random.RandomState(seed)
+    for _ in range(count):
+        yield generate_map(rng.randint(2, 25), rng.randint(2, 25), rng)
+
+
+def assert_route(grid, start, goal, distance, path):
+    col, row = grid.shape
+    assert path[0] == start and path[-1] == goal and len(path) == distance + 1
+    for (x, y), square in zip(path, path[1:]):
+        assert grid[square] != -1 and square in [((x + mov_x) % col, y + mov_y) for mov_x, mov_y in MOVES]
+
+
+def test_query_matches_solve():
+    cache = DistanceCache()
+    for grid, start, goal in seeded_maps(60, seed=10):
+        explored, path = solve(grid, start, goal)
+        distance, route = cache.query(grid, start, goal)
+        if path is None:
+            assert distance is None and route is None
+        else:
+            assert distance == explored[goal]
+            assert_route(grid, start, goal, distance, route)
+
+
+def test_query_reuses_the_field_of_the_goal():
+    for grid, start, goal in seeded_maps(60, seed=11):
+        explored, path = solve(grid, start, goal)
+        if path is None or start == goal:
+            continue
+        cache = DistanceCache()
+        cache.field(grid, goal)
+        distance, route = cache.query(grid, start, goal)
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1) # Nothing explored from the start.
+        assert distance == explored[goal]
+        assert_route(grid, start, goal, distance, route)
+
+
+def test_fields_are_counted_and_dropped_least_recently_used_first():
+    grid = generate_map(20, 20, np.random.RandomState(12))[0]
+    squares = [square for square in np.ndindex(grid.shape) if grid[square] != -1][:4]
+    field_bytes = distance_field(grid, squares[0]).nbytes
+    cache = DistanceCache(max_bytes=2 * field_bytes)
+    key = grid_key(grid)
+
+    cache.field(grid, squares[0], key)
+    cache.field(grid, squares[1], key)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert (cache.field(grid, squares[0], key) == distance_field(grid, squares[0])).all()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.field(grid, squares[2], key) # Drops squares[1], used less recently than squares[0].
+    assert cache.lookup(key, squares[1]) is None
+    assert cache.lookup(key, squares[0]) is not None and cache.lookup(key, squares[2]) is not None
+    assert len(cache) == 2 and cache.nbytes == 2 * field_bytes <= cache.max_bytes
+
+    cache.field(grid, squares[1], key)
+    assert (cache.hits, cache.misses) == (1, 4)
+    assert cache.lookup(key, squares[0]) is None
+
+    small = DistanceCache(max_bytes=field_bytes - 1)
+    small.field(grid, squares[0])
+    assert len(small) == 0 and small.nbytes == 0
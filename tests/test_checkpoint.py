@@ -0,0 +1,72 @@
+import io
+
+import numpy as np
+import pytest
+
+from landmarks import LandmarkIndex
+from solver import Adventurer, generate_map
+
+
+
+ALGORITHMS = ["BFS", "DFS", "BFS-vec", "A*", "BFS-bi"]
+
+
+def seeded_map(seed):
+    return generate_map(30, 20, np.random.RandomState(seed))
+
+
+@pytest.mark.parametrize("alg", ALGORITHMS)
+def test_events_follow_the_search(alg):
+    for seed in range(20):
+        grid, start, goal = seeded_map(seed)
+        expected = Adventurer(grid.copy(), start, goal, alg)
+        expected.explore()
+        route = expected.backtrack() if expected.arrived else []
+
+        traveller = Adventurer(grid.copy(), start, goal, alg)
+        events = list(traveller.events())
+        assert [square for kind, square in events if kind == "path"] == route
+        assert (("goal", goal) in events) == expected.arrived
+        assert (traveller.map == expected.map).all()
+
+        batches = list(Adventurer(grid.copy(), start, goal, alg).events(batch=7))
+        assert all(1 <= len(events) <= 7 for events in batches)
+        assert sum(batches, []) == events
+
+
+@pytest.mark.parametrize("alg", ALGORITHMS)
+def test_restored_search_continues_the_same_way(alg):
+    for seed in range(20):
+        grid, start, goal = seeded_map(seed)
+        traveller = Adventurer(grid.copy(), start, goal, alg)
+        for _ in range(10):
+            if traveller.arrived or not traveller.possible:
+                break
+            traveller.step_forward()
+        file = io.BytesIO()
+        traveller.checkpoint(file)
+        file.seek(0)
+
+        restored = Adventurer.restore(file)
+        assert list(restored.events()) == list(traveller.events())
+        assert (restored.map == traveller.map).all()
+
+
+def test_restore_requires_the_same_landmarks():
+    grid, start, goal = seeded_map(0)
+    landmarks = LandmarkIndex(grid)
+    for used, given in [(landmarks, None), (None, landmarks)]:
+        traveller = Adventurer(grid.copy(), start, goal, "A*", landmarks=used)
+        traveller.step_forward()
+        file = io.BytesIO()
+        traveller.checkpoint(file)
+        file.seek(0)
+        with pytest.raises(ValueError):
+            Adventurer.restore(file, landmarks=given)
+
+    traveller = Adventurer(grid.copy(), start, goal, "A*", landmarks=landmarks)
+    file = io.BytesIO()
+    traveller.checkpoint(file)
+    file.seek(0)
+    restored = Adventurer.restore(file, landmarks=landmarks)
+    assert list(restored.events()) == list(traveller.events())
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from cache import distance_field
+from connectivity import ConnectivityIndex
+from solver import generate_map, solve
+
+
+
+def wrapping_maps(rng):
+    """Maps whose regions are only joined across the wrapping column, by a wall column cutting the map in two and a
+    second one with a single gap which is sometimes closed.
+    """
+    col, row = rng.randint(4, 20), rng.randint(2, 20)
+    grid = np.where(rng.randint(0, 4, (col, row)) > 0, -2, -1)
+    grid[col // 2] = -1
+    grid[0] = -1
+    grid[0, rng.randint(row)] = -2 if rng.randint(2) else -1
+    return grid
+
+
+def polar_maps(rng):
+    """Maps cut in two by a wall row, whose halves would be joined if moves wrapped across the poles."""
+    col, row = rng.randint(2, 20), rng.randint(3, 20)
+    grid = np.where(rng.randint(0, 4, (col, row)) > 0, -2, -1)
+    grid[:, rng.randint(1, row - 1)] = -1
+    grid[:, 0] = grid[:, -1] = -2
+    return grid
+
+
+@pytest.mark.parametrize("maps", ["random", "wrapping", "polar"])
+def test_reachable_matches_distance_field(maps):
+    rng = np.random.RandomState(7)
+    for _ in range(40):
+        if maps == "random":
+            grid = generate_map(rng.randint(2, 25), rng.randint(2, 25), rng)[0]
+        else:
+            grid = wrapping_maps(rng) if maps == "wrapping" else polar_maps(rng)
+        index = ConnectivityIndex(grid)
+        col, row = grid.shape
+        for _ in range(10):
+            start = (rng.randint(col), rng.randint(row))
+            field = distance_field(grid, start)
+            for goal in np.ndindex(col, row):
+                expected = grid[start] != -1 and field[goal] >= 0
+                assert index.reachable(start, goal) == expected
+            assert index.region_size(start) == (np.count_nonzero(field >= 0) if grid[start] != -1 else 0)
+
+
+def test_unreachable_goal_is_not_explored():
+    rng = np.random.RandomState(8)
+    for _ in range(20):
+        grid = polar_maps(rng)
+        col, row = grid.shape
+        start, goal = (rng.randint(col), 0), (rng.randint(col), row - 1)
+        index = ConnectivityIndex(grid)
+        assert not index.reachable(start, goal)
+
+        explored, path = solve(grid, start, goal, "BFS", connectivity=index)
+        assert path is None
+        expected = np.where(grid == -1, -1, -2)
+        expected[start] = 0
+        assert (explored == expected).all()
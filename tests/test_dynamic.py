@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from cache import distance_field
+from dynamic import IncrementalField
+from solver import generate_map
+
+
+
+def expected_field(walls, source):
+    """Distance field recomputed from scratch for the current walls, where nothing is reached from a walled source."""
+    if walls[source]:
+        return np.where(walls, -1, -2).astype(np.int32)
+    return distance_field(np.where(walls, -1, -2), source)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_edits_match_recomputation(seed):
+    rng = np.random.RandomState(seed)
+    grid, source, _ = generate_map(rng.randint(2, 25), rng.randint(2, 25), rng)
+    walls = grid == -1
+    field = IncrementalField(grid, source)
+    col, row = walls.shape
+    for _ in range(15):
+        squares = [(rng.randint(col), rng.randint(row)) for _ in range(rng.randint(1, 5))]
+        if rng.rand() < 0.2:
+            squares += [source] # Closing and reopening the source itself.
+        changed_before = expected_field(walls, source)
+        if rng.rand() < 0.5:
+            changed = field.add_walls(squares)
+            for square in squares:
+                walls[square] = True
+        else:
+            changed = field.remove_walls(squares)
+            for square in squares:
+                walls[square] = False
+        expected = expected_field(walls, source)
+        assert (field.field == expected).all()
+        # Every square whose distance changed is reported.
+        assert set(zip(*np.nonzero(changed_before != expected))) <= changed
+
+
+def test_reopened_source_reaches_again():
+    grid, source, goal = generate_map(20, 15, np.random.RandomState(3))
+    field = IncrementalField(grid, source)
+    before = field.field.copy()
+
+    field.add_walls([source])
+    assert (field.field < 0).all()
+
+    field.remove_walls([source])
+    assert (field.field == before).all()
+    assert (field.field == distance_field(grid, source)).all()
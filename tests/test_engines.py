@@ -0,0 +1,139 @@
+import time
+
+import numpy as np
+import pytest
+
+from batch import generate_maps, solve_batch
+from compact import CompactGrid
+from landmarks import LandmarkIndex
+from solver import MOVES, Adventurer, generate_map, solve
+
+
+
+def baseline_steps(grid, start, goal, alg):
+    """Explores the map with the original list based BFS or DFS, returning the squares explored by each step, such that
+    the order of the exploration can be compared and not only its result.
+    """
+    col, row = grid.shape
+    to_visit = [start]
+    steps = []
+    while to_visit:
+        x, y = to_visit.pop(-1 if alg == "DFS" else 0)
+        new_squares = []
+        for mov_x, mov_y in MOVES:
+            if 0 <= y + mov_y < row:
+                square = ((x + mov_x) % col, y + mov_y)
+                if grid[square] == -2 or grid[square] > grid[x, y] + 1:
+                    if square in to_visit:
+                        to_visit.remove(square)
+                    grid[square] = grid[x, y] + 1
+                    if grid[goal] == -2 or grid[x, y] < grid[goal]:
+                        to_visit += [square]
+                    new_squares += [square]
+        steps += [new_squares]
+    return steps
+
+
+def seeded_maps(count, seed=0):
+    rng = np.random.RandomState(seed)
+    for _ in range(count):
+        yield generate_map(rng.randint(2, 30), rng.randint(2, 30), rng)
+
+
+@pytest.mark.parametrize("alg", ["BFS", "DFS"])
+def test_frontier_keeps_baseline_step_order(alg):
+    for grid, start, goal in seeded_maps(60):
+        expected = grid.copy()
+        steps = baseline_steps(expected, start, goal, alg)
+        traveller = Adventurer(grid.copy(), start, goal, alg)
+        for new_squares in steps:
+            assert traveller.step_forward() == new_squares
+        traveller.step_forward()
+        assert not traveller.possible or traveller.arrived
+        assert (traveller.map == expected).all()
+
+
+def test_vectorized_bfs_matches_bfs():
+    for grid, start, goal in seeded_maps(100, seed=1):
+        distances, path = solve(grid, start, goal, "BFS")
+        vec_distances, vec_path = solve(grid, start, goal, "BFS-vec")
+        assert (vec_distances == distances).all()
+        assert vec_path == path
+
+
+def test_batch_matches_solve():
+    grids, starts, goals = generate_maps(40, 17, 23, np.random.RandomState(2))
+    distances, arrived, routes = solve_batch(grids, starts, goals, paths=True)
+    for i in range(len(grids)):
+        expected, path = solve(grids[i], tuple(starts[i]), tuple(goals[i]))
+        assert (distances[i] == expected).all()
+        assert arrived[i] == (path is not None)
+        assert routes[i] == path
+
+
+def test_compact_grid_matches_bfs():
+    for grid, start, goal in seeded_maps(60, seed=3):
+        compact = CompactGrid.from_map(grid, start, goal)
+        arrived = compact.solve()
+        path = compact.backtrack()
+
+        traveller = Adventurer(grid.copy(), start, goal, "BFS")
+        traveller.explore()
+        assert arrived == traveller.arrived
+        if traveller.arrived:
+            assert path == traveller.backtrack()
+        assert (compact.to_map() == traveller.map).all()
+
+
+@pytest.mark.parametrize("alg", ["bfs", "Dijkstra", "", None])
+def test_unknown_algorithm_is_rejected(alg):
+    grid, start, goal = generate_map(5, 5, np.random.RandomState(0))
+    with pytest.raises(ValueError):
+        solve(grid, start, goal, alg)
+
+
+def test_search_time_only_counts_stepping():
+    grid, start, goal = generate_map(20, 20, np.random.RandomState(4))
+    traveller = Adventurer(grid.copy(), start, goal, "BFS")
+    time.sleep(0.05)
+    assert traveller.step_batch(3) and traveller.stats.steps == 3
+    time.sleep(0.05)
+    traveller.explore()
+    assert 0 < traveller.stats.search_time < 0.05
+
+
+def assert_valid_route(grid, start, goal, path):
+    col, row = grid.shape
+    assert path[0] == start and path[-1] == goal
+    assert all(grid[square] != -1 for square in path)
+    for (x, y), square in zip(path, path[1:]):
+        assert square in [((x + mov_x) % col, y + mov_y) for mov_x, mov_y in MOVES]
+
+
+@pytest.mark.parametrize("alg, use_landmarks", [("A*", False), ("A*", True), ("BFS-bi", False)])
+def test_informed_searches_match_bfs(alg, use_landmarks):
+    for grid, start, goal in seeded_maps(100, seed=5):
+        landmarks = LandmarkIndex(grid) if use_landmarks else None
+        distances, path = solve(grid, start, goal, "BFS")
+        _, alg_path = solve(grid, start, goal, alg, landmarks=landmarks)
+        assert (alg_path is None) == (path is None)
+        if path is not None:
+            assert len(alg_path) == len(path) == distances[goal] + 1
+            assert_valid_route(grid, start, goal, alg_path)
+
+
+@pytest.mark.parametrize("alg, use_landmarks", [("A*", False), ("A*", True), ("BFS-bi", False)])
+def test_informed_searches_expand_no_more_than_bfs(alg, use_landmarks):
+    rng = np.random.RandomState(6)
+    for _ in range(5):
+        grid = np.where(rng.randint(0, 10, (120, 90)) > 0, -2, -1) # Mostly open, one square in ten is a wall.
+        start, goal = (5, 10), (70, 80)
+        grid[start], grid[goal] = 0, -2
+        landmarks = LandmarkIndex(grid) if use_landmarks else None
+
+        bfs = Adventurer(grid.copy(), start, goal, "BFS")
+        bfs.explore()
+        traveller = Adventurer(grid.copy(), start, goal, alg, landmarks=landmarks)
+        traveller.explore()
+        assert traveller.arrived and traveller.map[goal] == bfs.map[goal]
+        assert traveller.expanded <= bfs.stats.popped
@@ -0,0 +1,23 @@
+import numpy as np
+
+from cache import distance_field
+from landmarks import LandmarkIndex
+from solver import generate_map
+
+
+
+def test_bounds_never_exceed_the_distance():
+    rng = np.random.RandomState(9)
+    for _ in range(60):
+        grid = generate_map(rng.randint(2, 30), rng.randint(2, 30), rng)[0]
+        index = LandmarkIndex(grid, count=rng.randint(1, 6))
+        col, row = grid.shape
+        for _ in range(5):
+            goal = (rng.randint(col), rng.randint(row))
+            if grid[goal] == -1:
+                continue
+            field = distance_field(grid, goal)
+            reached = field >= 0
+            assert (index.bounds(goal)[reached] <= field[reached]).all()
+            for start in zip(*np.nonzero(reached)):
+                assert index.lower_bound(start, goal) <= field[start]
@@ -0,0 +1,33 @@
+import numpy as np
+
+from pool import SolvePool
+from solver import solve
+
+
+
+def run(seed):
+    with SolvePool(12, 15, 11, processes=2) as pool:
+        starts, goals = pool.generate(seed, chunksize=5)
+        routes = dict(pool.solve(starts, goals, chunksize=5))
+        return pool.grids.copy(), pool.distances.copy(), starts, goals, routes
+
+
+def test_same_seed_gives_the_same_maps_and_routes():
+    grids, distances, starts, goals, routes = run(13)
+    again = run(13)
+    assert (again[0] == grids).all()
+    assert again[2:4] == (starts, goals)
+    assert not (run(14)[0] == grids).all()
+
+    assert sorted(routes) == list(range(len(grids)))
+    for i in range(len(grids)):
+        explored, path = solve(grids[i], starts[i], goals[i])
+        assert (distances[i] == explored).all()
+        assert routes[i] == path
+
+
+def test_close_twice():
+    with SolvePool(2, 5, 5, processes=1) as pool:
+        pool.close()
+    pool.close()
+    assert pool.grids is None
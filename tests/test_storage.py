@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from compact import CompactGrid
+from solver import generate_map
+from storage import HEADER, create_grid, layout, open_grid, save_grid
+
+
+
+def seeded_grid(seed):
+    grid, start, goal = generate_map(30, 21, np.random.RandomState(seed))
+    return CompactGrid.from_map(grid, start, goal)
+
+
+@pytest.mark.parametrize("solved", [False, True])
+@pytest.mark.parametrize("distances", [False, True])
+def test_saved_map_opens_the_same(tmp_path, solved, distances):
+    path = str(tmp_path / "map.grid")
+    for seed in range(5):
+        grid = seeded_grid(seed)
+        if solved:
+            grid.solve()
+        save_grid(path, grid, distances)
+
+        opened = open_grid(path, "r")
+        assert (opened.col, opened.row, opened.start, opened.goal) == (grid.col, grid.row, grid.start, grid.goal)
+        assert (np.asarray(opened.walls) == grid.walls).all()
+        if distances:
+            assert (np.asarray(opened.distances) == grid.distances).all()
+        else:
+            assert (opened.distances == opened.unreached).all()
+
+
+def test_created_map_is_empty_and_unreached(tmp_path):
+    path = str(tmp_path / "map.grid")
+    created = create_grid(path, 12, 9, (0, 0), (11, 8))
+    created.set_wall((3, 4))
+    created.walls.flush()
+
+    opened = open_grid(path, "r")
+    assert (opened.col, opened.row, opened.start, opened.goal) == (12, 9, (0, 0), (11, 8))
+    assert opened.is_wall((3, 4)) and np.count_nonzero(np.unpackbits(np.asarray(opened.walls))) == 1
+    assert (opened.distances == opened.unreached).all()
+
+
+@pytest.mark.parametrize("distances", [False, True])
+def test_truncated_file_is_rejected(tmp_path, distances):
+    path = tmp_path / "map.grid"
+    save_grid(str(path), seeded_grid(0), distances)
+    # Files without distances are padded up to where the distances would start, so only cut into the walls there.
+    walls_offset, walls_shape, _, _ = layout(30, 21)
+    size = path.stat().st_size - 1 if distances else walls_offset + walls_shape[0] * walls_shape[1] - 1
+    path.write_bytes(path.read_bytes()[:size])
+    with pytest.raises(ValueError):
+        open_grid(str(path))
+    assert path.stat().st_size == size # Not extended by the memory map.
+
+
+@pytest.mark.parametrize("contents", [b"", b"BFSGRID", b"not a map file at all" * 10])
+def test_foreign_file_is_rejected(tmp_path, contents):
+    path = tmp_path / "other"
+    path.write_bytes(contents)
+    with pytest.raises(ValueError):
+        open_grid(str(path))
+
+
+@pytest.mark.parametrize("field, value", [("start", (12, 0)), ("goal", (0, 9)), ("distance_size", 3)])
+def test_bad_header_is_rejected(tmp_path, field, value):
+    path = tmp_path / "map.grid"
+    create_grid(str(path), 12, 9, (0, 0), (11, 8))
+    header = np.fromfile(str(path), dtype=HEADER, count=1)
+    header[0][field] = value
+    path.write_bytes(header.tobytes() + path.read_bytes()[HEADER.itemsize:])
+    with pytest.raises(ValueError):
+        open_grid(str(path))
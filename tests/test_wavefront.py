@@ -0,0 +1,35 @@
+import numpy as np
+
+from cache import distance_field
+from wavefront import multi_source_field, wall_distance
+
+
+
+def test_multi_source_field_matches_nearest_single_source():
+    rng = np.random.RandomState(0)
+    for _ in range(100):
+        grid = np.where(rng.rand(rng.randint(1, 20), rng.randint(1, 20)) < 0.3, -1, -2)
+        empty = np.argwhere(grid != -1)
+        if not len(empty):
+            continue
+        sources = [tuple(empty[i]) for i in rng.randint(len(empty), size=rng.randint(1, 6))]
+        field, nearest = multi_source_field(grid, sources)
+
+        single = np.array([distance_field(grid, source) for source in sources]).astype(float)
+        single[single < 0] = np.inf
+        closest = single.min(axis=0)
+        assert (field == np.where(grid == -1, -1, np.where(np.isinf(closest), -2, closest))).all()
+
+        # Ties go to the first of the sources, including repeated ones.
+        reached = np.nonzero(field >= 0)
+        assert (nearest[reached] == np.argmin(single[(slice(None),) + reached], axis=0)).all()
+        assert (nearest[field < 0] == -1).all()
+
+
+def test_wall_distance():
+    grid = np.full((5, 3), -2)
+    grid[0, 0] = -1
+    distances = wall_distance(grid)
+    assert distances[0, 0] == 0
+    assert distances[1, 0] == distances[4, 0] == distances[0, 1] == 1 # The map wraps along the columns.
+    assert distances[2, 2] == 4
@@ -0,0 +1,122 @@
+import numpy as np
+
+
+
+def neighbours(mask):
+    """Finds every square adjacent to a square in the mask. The map wraps horizontally, along the second to last axis,
+    but not vertically along the last axis, as that would imply travelling from one pole to the other. Any leading axes
+    are treated as separate maps.
+
+    Args:
+        mask (NumPy bool array [..., col, row]).
+
+    Returns:
+        NumPy bool array [..., col, row]: True for each square next to at least one square of the mask.
+    """
+    near = np.roll(mask, 1, axis=-2)
+    near |= np.roll(mask, -1, axis=-2)
+    near[..., 1:] |= mask[..., :-1]
+    near[..., :-1] |= mask[..., 1:]
+    return near
+
+
+def neighbour_minimum(values):
+    """Finds the lowest value among the squares adjacent to each square, with the same moves as neighbours.
+
+    Args:
+        values (NumPy array [..., col, row]).
+
+    Returns:
+        NumPy array [..., col, row]: the lowest value of the neighbours of each square.
+    """
+    lowest = np.minimum(np.roll(values, 1, axis=-2), np.roll(values, -1, axis=-2))
+    lowest[..., 1:] = np.minimum(lowest[..., 1:], values[..., :-1])
+    lowest[..., :-1] = np.minimum(lowest[..., :-1], values[..., 1:])
+    return lowest
+
+
+def expand_layer(grid, layer, unexplored, distance):
+    """Explores every square next to the layer at once, in the same way BFS explores the squares of one distance.
+
+    Args:
+        grid (NumPy array [..., col, row]): map holding the distances, the new squares are written into it.
+        layer (NumPy bool array [..., col, row]): squares which are all at the given distance from the start.
+        unexplored (NumPy bool array [..., col, row]): squares which are neither walls nor explored, updated in place.
+        distance (int): distance of the squares in the layer.
+
+    Returns:
+        NumPy bool array [..., col, row]: the newly explored squares, which are at distance + 1.
+    """
+    new = neighbours(layer)
+    new &= unexplored
+    unexplored &= ~new
+    grid[new] = distance + 1
+    return new
+
+
+def wavefront_search(grid, start, goal=None):
+    """Explores the map one whole layer at a time, producing the same distances as the BFS of Adventurer. Once the goal
+    is reached, the squares of its layer are still expanded, after which the exploration stops.
+
+    Args:
+        grid (NumPy array [col, row]): map with walls as -1, unexplored squares as -2 and the start as 0, updated in place.
+        start (int, int): where the exploration begins.
+        goal (int, int): the square to be reached, if None the whole area connected to the start is explored.
+
+    Returns:
+        Bool: if the goal was reached or not, always False without a goal.
+    """
+    layer = np.zeros(grid.shape, dtype=bool)
+    layer[start] = True
+    unexplored = grid == -2
+    distance = grid[start]
+    while layer.any():
+        layer = expand_layer(grid, layer, unexplored, distance)
+        if goal is not None and 0 <= grid[goal] <= distance:
+            break
+        distance += 1
+    return goal is not None and grid[goal] >= 0
+
+
+def multi_source_field(grid, sources):
+    """Finds the distance from every square to the nearest of several sources, exploring from all of them at once one
+    layer at a time, see expand_layer. Each newly reached square takes the source of whichever of its neighbours in the
+    previous layer has the lowest index, see neighbour_minimum, so squares as far from two sources go to the first one.
+
+    Args:
+        grid (NumPy array [col, row]): map where walls are -1, every other value is treated as an empty square. It is not modified.
+        sources (List of (int, int)): squares from which the distances are measured, which may also be walls.
+
+    Returns:
+        NumPy int32 array [col, row], NumPy int32 array [col, row]: the distances, in the same format as cache.distance_field,
+            and the index in sources of the nearest source of each square, -1 for squares which can't be reached.
+    """
+    none = np.iinfo(np.int32).max
+    field = np.where(grid == -1, -1, -2).astype(np.int32)
+    nearest = np.full(grid.shape, none, dtype=np.int32)
+    x, y = np.array(sources, dtype=np.int64).reshape(-1, 2).T
+    np.minimum.at(nearest, (x, y), np.arange(len(x), dtype=np.int32)) # The first of any repeated sources is kept.
+    field[x, y] = 0
+
+    layer = nearest != none
+    nearest[~layer] = -1
+    unexplored = field == -2
+    distance = 0
+    while layer.any():
+        new = expand_layer(field, layer, unexplored, distance)
+        nearest[new] = neighbour_minimum(np.where(layer, nearest, none))[new]
+        layer = new
+        distance += 1
+    return field, nearest
+
+
+def wall_distance(grid):
+    """Finds the distance from every square to the nearest wall, see multi_source_field.
+
+    Args:
+        grid (NumPy array [col, row]): map where walls are -1. It is not modified.
+
+    Returns:
+        NumPy int32 array [col, row]: 0 for walls, otherwise the distance, or -2 if no wall can be reached.
+    """
+    return multi_source_field(grid, np.argwhere(grid == -1))[0]